@@ -26,50 +26,60 @@ Docker containers and their associated data with minimal downtime and maximum
 reliability.
 """
 
+import importlib
+
 # Version and metadata
 from .helpers.constants import VERSION
 
 __version__ = VERSION
 __author__ = "Markus F. (TZERO78) & KI-Assistenten"
 
-# Logging utilities
-from .helpers.logging import (
-    get_logger,
-    log_manager,
-    setup_logging,
-    StructuredFormatter,
-    Colors,
-)
+# Public names re-exported from submodules. Resolved on first attribute
+# access (PEP 562) so that importing a single submodule - which always runs
+# this file first - does not load every core manager and its dependencies.
+_LAZY_EXPORTS = {
+    # Logging utilities
+    "get_logger": ".helpers.logging",
+    "log_manager": ".helpers.logging",
+    "setup_logging": ".helpers.logging",
+    "StructuredFormatter": ".helpers.logging",
+    "Colors": ".helpers.logging",
+    # Type definitions
+    "BackupUnit": ".types",
+    "ContainerInfo": ".types",
+    "VolumeInfo": ".types",
+    "BackupMetadata": ".types",
+    "RestorePoint": ".types",
+    # Configuration and helpers
+    "Config": ".helpers",
+    "create_default_config": ".helpers",
+    "generate_secure_password": ".helpers",
+    # Core business logic
+    "BackupManager": ".cores",
+    "RestoreManager": ".cores",
+    "DockerDiscovery": ".cores",
+    "KopiaRepository": ".cores",
+    "DependencyManager": ".cores",
+    "DryRunReport": ".cores",
+    "DisasterRecoveryManager": ".cores",
+    "KopiDockaService": ".cores",
+    "ServiceConfig": ".cores",
+    "KopiaPolicyManager": ".cores",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Type definitions
-from .types import (
-    BackupUnit,
-    ContainerInfo,
-    VolumeInfo,
-    BackupMetadata,
-    RestorePoint,
-)
 
-# Configuration and helpers
-from .helpers import (
-    Config,
-    create_default_config,
-    generate_secure_password,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Core business logic
-from .cores import (
-    BackupManager,
-    RestoreManager,
-    DockerDiscovery,
-    KopiaRepository,
-    DependencyManager,
-    DryRunReport,
-    DisasterRecoveryManager,
-    KopiDockaService,
-    ServiceConfig,
-    KopiaPolicyManager,
-)
 
 __all__ = [
     # Version
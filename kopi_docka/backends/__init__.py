@@ -4,35 +4,36 @@ Storage Backend Module
 Provides backend classes for different storage types (filesystem, cloud, etc.).
 Each backend handles setup configuration and status display.
 
-Note: Backend registration is handled by BACKEND_MODULES in config_commands.py,
-not by a registry pattern here. This keeps the code simple and explicit.
+Backends are registered by name as "module:Class" strings and imported on
+first lookup, so selecting one backend does not load the others.
 """
 
+import importlib
+
 from .base import BackendBase, BackendError, DependencyError, ConfigurationError, ConnectionError
 
+# Repository type (first token of kopia_params) -> "module:Class"
+_BACKEND_CLASSES = {
+    "filesystem": ".local:LocalBackend",
+    "s3": ".s3:S3Backend",
+    "b2": ".b2:B2Backend",
+    "azure": ".azure:AzureBackend",
+    "gcs": ".gcs:GCSBackend",
+    "sftp": ".sftp:SFTPBackend",
+    "tailscale": ".tailscale:TailscaleBackend",
+    "rclone": ".rclone:RcloneBackend",
+}
+
+BACKEND_TYPES = tuple(_BACKEND_CLASSES)
+
 
 def get_backend_class(backend_type: str):
-    """Get backend class by type name."""
-    from .local import LocalBackend
-    from .s3 import S3Backend
-    from .b2 import B2Backend
-    from .azure import AzureBackend
-    from .gcs import GCSBackend
-    from .sftp import SFTPBackend
-    from .tailscale import TailscaleBackend
-    from .rclone import RcloneBackend
-
-    BACKEND_REGISTRY = {
-        "filesystem": LocalBackend,
-        "s3": S3Backend,
-        "b2": B2Backend,
-        "azure": AzureBackend,
-        "gcs": GCSBackend,
-        "sftp": SFTPBackend,
-        "tailscale": TailscaleBackend,
-        "rclone": RcloneBackend,
-    }
-    return BACKEND_REGISTRY.get(backend_type)
+    """Get backend class by type name (imports only that backend's module)."""
+    target = _BACKEND_CLASSES.get(backend_type)
+    if target is None:
+        return None
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name, __name__), class_name)
 
 
 # Export public API
@@ -42,5 +43,6 @@ __all__ = [
     "DependencyError",
     "ConfigurationError",
     "ConnectionError",
+    "BACKEND_TYPES",
     "get_backend_class",
 ]
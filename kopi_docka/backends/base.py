@@ -9,6 +9,15 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
+# Generic markdown for BackendBase.get_recovery_instructions()
+_RECOVERY_TEMPLATE = """
+## {display_name} Recovery
+
+1. Install required dependencies: {dependencies}
+2. Restore credentials from the recovery bundle
+3. Test connection: kopia repository status
+4. Proceed with data restore
+"""
 
 
 class BackendBase(ABC):
@@ -213,14 +222,10 @@ class BackendBase(ABC):
         Returns:
             Markdown-formatted instructions
         """
-        return f"""
-## {self.display_name} Recovery
-
-1. Install required dependencies: {', '.join(self.check_dependencies()) or 'None'}
-2. Restore credentials from the recovery bundle
-3. Test connection: kopia repository status
-4. Proceed with data restore
-"""
+        return _RECOVERY_TEMPLATE.format(
+            display_name=self.display_name,
+            dependencies=", ".join(self.check_dependencies()) or "None",
+        )
 
     def get_status(self) -> dict:
         """
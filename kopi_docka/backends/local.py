@@ -4,10 +4,42 @@ Local Filesystem Backend Configuration
 Store backups on local disk, NAS mount, USB drive, etc.
 """
 
+import functools
+import os
+import shlex
+import shutil
+from pathlib import Path
+from typing import Optional
+
 import typer
 from .base import BackendBase
 
 
+@functools.lru_cache(maxsize=8)
+def _repo_path_from_params(kopia_params: str) -> Optional[Path]:
+    """Extract the ``--path`` value from ``kopia_params`` (memoized per string).
+
+    Keyed on the params string itself, so a mutated config simply misses
+    the cache instead of returning a stale path.
+    """
+    if not kopia_params:
+        return None
+    parts = shlex.split(kopia_params)
+    if "--path" in parts:
+        idx = parts.index("--path")
+        if idx + 1 < len(parts):
+            return Path(parts[idx + 1]).expanduser()
+    return None
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Single ``stat`` call; ``None`` if the path is missing or inaccessible."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 class LocalBackend(BackendBase):
     """Local filesystem backend for Kopia"""
 
@@ -78,17 +110,11 @@ Make sure:
 
     def get_kopia_args(self) -> list:
         """Get Kopia arguments from kopia_params."""
-        import shlex
-
         kopia_params = self.config.get("kopia_params", "")
         return shlex.split(kopia_params) if kopia_params else []
 
     def get_status(self) -> dict:
         """Get filesystem storage status including disk space."""
-        import shutil
-        import os
-        from pathlib import Path
-
         status = {
             "repository_type": self.name,
             "configured": bool(self.config),
@@ -102,48 +128,31 @@ Make sure:
             },
         }
 
-        # Extract path from kopia_params
-        kopia_params = self.config.get("kopia_params", "")
-        if not kopia_params:
-            return status
-
         # Parse path from "filesystem --path /backup/kopia-repository"
-        import shlex
-
         try:
-            parts = shlex.split(kopia_params)
-            if "--path" in parts:
-                idx = parts.index("--path")
-                if idx + 1 < len(parts):
-                    path = Path(parts[idx + 1])
-                    status["details"]["path"] = str(path)
-
-                    # Check if path exists
-                    status["details"]["exists"] = path.exists()
-
-                    # Check if writable
-                    if path.exists():
-                        status["details"]["writable"] = os.access(path, os.W_OK)
-                        status["available"] = status["details"]["writable"]
-
-                        # Get disk space
-                        try:
-                            disk_usage = shutil.disk_usage(path)
-                            status["details"]["disk_total_gb"] = disk_usage.total / (1024**3)
-                            status["details"]["disk_free_gb"] = disk_usage.free / (1024**3)
-                        except Exception:
-                            pass
-                    elif path.parent.exists():
-                        # Path doesn't exist yet, but parent does - check parent
-                        status["details"]["writable"] = os.access(path.parent, os.W_OK)
-                        status["available"] = status["details"]["writable"]
-
-                        try:
-                            disk_usage = shutil.disk_usage(path.parent)
-                            status["details"]["disk_total_gb"] = disk_usage.total / (1024**3)
-                            status["details"]["disk_free_gb"] = disk_usage.free / (1024**3)
-                        except Exception:
-                            pass
+            path = _repo_path_from_params(self.config.get("kopia_params", ""))
+            if path is None:
+                return status
+            status["details"]["path"] = str(path)
+
+            # One stat answers "exists"; if the repo isn't there yet, fall
+            # back to the parent (where `kopia repository create` would write).
+            target = path
+            status["details"]["exists"] = _stat_or_none(path) is not None
+            if not status["details"]["exists"]:
+                target = path.parent
+                if _stat_or_none(target) is None:
+                    return status
+
+            status["details"]["writable"] = os.access(target, os.W_OK)
+            status["available"] = status["details"]["writable"]
+
+            try:
+                disk_usage = shutil.disk_usage(target)
+                status["details"]["disk_total_gb"] = disk_usage.total / (1024**3)
+                status["details"]["disk_free_gb"] = disk_usage.free / (1024**3)
+            except Exception:
+                pass
 
         except Exception:
             pass
@@ -21,8 +21,8 @@ Uses Kopia's built-in rclone support to connect to any cloud storage
 that rclone supports (OneDrive, Dropbox, Google Drive, etc.).
 """
 
+import os
 import re
-import shutil
 import socket
 import subprocess
 from enum import Enum
@@ -32,6 +32,10 @@ from typing import Dict, List, NamedTuple, Optional, Tuple
 import typer
 
 from .base import BackendBase
+from ..helpers.constants import (
+    RCLONE_CONFIG_SUBPATH,
+    ROOT_RCLONE_CONFIG,
+)
 from ..helpers.dependency_helper import DependencyHelper, ToolInfo
 from ..helpers.sudo_helper import get_sudo_user_info, sudo_user_home_path
 from ..helpers.ui_utils import run_command, SubprocessError
@@ -76,6 +80,11 @@ def get_default_remote_path() -> str:
     return f"kopia-backup_{clean_hostname}"
 
 
+def _rclone_cmd(*args: str, config_path: Optional[str] = None) -> List[str]:
+    """Build an rclone argv, with ``--config`` only when a config path is known."""
+    return ["rclone", *args, *(("--config", config_path) if config_path else ())]
+
+
 class RcloneBackend(BackendBase):
     """
     Rclone backend implementation.
@@ -86,6 +95,11 @@ class RcloneBackend(BackendBase):
 
     REQUIRED_TOOLS = ["rclone"]
 
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        # Remote name → type per rclone config path, filled by _list_remotes()
+        self._remotes_cache: Dict[Optional[str], Dict[str, str]] = {}
+
     @property
     def name(self) -> str:
         return "rclone"
@@ -120,9 +134,9 @@ class RcloneBackend(BackendBase):
             - user_config_path: Path object for user config (or None if not available)
             - sudo_user_name: Name of the SUDO_USER (or None)
         """
-        root_config = Path("/root/.config/rclone/rclone.conf")
+        root_config = ROOT_RCLONE_CONFIG
         sudo_info = get_sudo_user_info()
-        user_config = sudo_user_home_path(".config/rclone/rclone.conf")
+        user_config = sudo_user_home_path(RCLONE_CONFIG_SUBPATH)
 
         # Check root config with PermissionError handling
         root_config_accessible = None
@@ -153,57 +167,47 @@ class RcloneBackend(BackendBase):
         - Preserves user settings: root_folder_id, etc.
 
         Priority:
-        1. /home/$SUDO_USER/.config/rclone/rclone.conf (if running with sudo)
-        2. /root/.config/rclone/rclone.conf (if running as actual root)
+        1. $RCLONE_CONFIG (if set)
+        2. /home/$SUDO_USER/.config/rclone/rclone.conf (if running with sudo)
+        3. /root/.config/rclone/rclone.conf (if running as actual root)
 
         Returns:
             ConfigDetectionResult with path, status, and checked_paths.
             Status can be FOUND, PERMISSION_DENIED, or NOT_FOUND.
         """
-        checked_paths = []
+        # Ordered lookup; the first existing (or unreadable) file wins
+        candidates: List[Path] = []
+        env_config = os.environ.get("RCLONE_CONFIG")
+        if env_config:
+            candidates.append(Path(env_config))
 
         # If running with sudo, prefer original user's config
         sudo_info = get_sudo_user_info()
         if sudo_info.invoked_with_sudo and sudo_info.name != "root":
-            user_config = sudo_user_home_path(".config/rclone/rclone.conf")
-            checked_paths.append(str(user_config))
+            candidates.append(sudo_user_home_path(RCLONE_CONFIG_SUBPATH))
 
+        # Fall back to root's config
+        candidates.append(ROOT_RCLONE_CONFIG)
+
+        checked_paths = []
+        for candidate in candidates:
+            checked_paths.append(str(candidate))
             try:
-                if user_config.exists():
-                    self._warn_if_config_readable_by_others(user_config)
+                if candidate.exists():
+                    self._warn_if_config_readable_by_others(candidate)
                     return ConfigDetectionResult(
-                        path=str(user_config),
+                        path=str(candidate),
                         status=ConfigStatus.FOUND,
                         checked_paths=checked_paths,
                     )
             except PermissionError:
                 # Config exists but cannot be read due to permissions
                 return ConfigDetectionResult(
-                    path=str(user_config),
+                    path=str(candidate),
                     status=ConfigStatus.PERMISSION_DENIED,
                     checked_paths=checked_paths,
                 )
 
-        # Fall back to root's config
-        root_config = Path("/root/.config/rclone/rclone.conf")
-        checked_paths.append(str(root_config))
-
-        try:
-            if root_config.exists():
-                self._warn_if_config_readable_by_others(root_config)
-                return ConfigDetectionResult(
-                    path=str(root_config),
-                    status=ConfigStatus.FOUND,
-                    checked_paths=checked_paths,
-                )
-        except PermissionError:
-            # Config exists but cannot be read due to permissions
-            return ConfigDetectionResult(
-                path=str(root_config),
-                status=ConfigStatus.PERMISSION_DENIED,
-                checked_paths=checked_paths,
-            )
-
         # No config found at any location
         return ConfigDetectionResult(
             path=None, status=ConfigStatus.NOT_FOUND, checked_paths=checked_paths
@@ -263,6 +267,43 @@ class RcloneBackend(BackendBase):
 
         return None
 
+    def _list_remotes(self, config_path: Optional[str] = None) -> Dict[str, str]:
+        """
+        List configured rclone remotes together with their storage type.
+
+        ``rclone listremotes --long`` prints one ``name: type`` line per
+        remote, so the listing costs one subprocess regardless of the number
+        of remotes and - unlike ``rclone config dump`` - never pipes tokens or
+        secrets through our process. Successful results are cached per config
+        path for the lifetime of this backend instance; clear
+        ``_remotes_cache`` after editing the config.
+
+        Args:
+            config_path: Optional path to rclone config file
+
+        Returns:
+            Dict mapping remote name to type (empty if none or on error)
+        """
+        if config_path in self._remotes_cache:
+            return self._remotes_cache[config_path]
+
+        cmd = _rclone_cmd("listremotes", "--long", config_path=config_path)
+
+        try:
+            result = run_command(cmd, "Listing rclone remotes", timeout=10, check=False)
+        except Exception:
+            return {}
+        if result.returncode != 0:
+            return {}
+
+        remotes = {}
+        for line in (result.stdout or "").splitlines():
+            name, sep, remote_type = line.partition(":")
+            if sep and name.strip():
+                remotes[name.strip()] = remote_type.strip() or "unknown"
+        self._remotes_cache[config_path] = remotes
+        return remotes
+
     def _test_rclone_connection(
         self, remote: str, path: str, config_path: Optional[str] = None
     ) -> tuple:
@@ -277,9 +318,12 @@ class RcloneBackend(BackendBase):
         Returns:
             Tuple of (success: bool, stderr: str)
         """
-        cmd = ["rclone", "lsd", f"{remote}:{path}"]
-        if config_path:
-            cmd.extend(["--config", config_path])
+        # Single attempt: a wrong remote or expired token should fail now,
+        # not after rclone's default retry rounds eat the 30s timeout.
+        cmd = _rclone_cmd(
+            "lsd", f"{remote}:{path}", "--retries", "1", "--low-level-retries", "1",
+            config_path=config_path,
+        )
 
         try:
             result = run_command(cmd, "Checking remote connection", timeout=30, check=False)
@@ -312,21 +356,20 @@ class RcloneBackend(BackendBase):
             parent = ""
             folder_name = path
 
-        cmd = ["rclone", "lsd", f"{remote}:{parent}"]
-        if config_path:
-            cmd.extend(["--config", config_path])
+        cmd = _rclone_cmd("lsd", f"{remote}:{parent}", config_path=config_path)
 
         try:
             result = run_command(cmd, "Checking path exists", timeout=30, check=False)
             # Check if the folder name appears in the output
             if result.returncode == 0:
                 # Parse lsd output - each line contains folder info
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip() and folder_name in line:
-                        # lsd format: "          -1 2024-01-01 00:00:00        -1 foldername"
-                        # The folder name is at the end
-                        parts = line.split()
-                        if parts and parts[-1] == folder_name:
+                # lsd format: "          -1 2024-01-01 00:00:00        -1 foldername"
+                # The folder name is everything after the 4 leading fields
+                # (it may itself contain spaces); cheap substring test first.
+                for line in result.stdout.splitlines():
+                    if folder_name in line:
+                        parts = line.split(None, 4)
+                        if len(parts) == 5 and parts[4] == folder_name:
                             return (True, "")
                 return (False, f"Folder '{path}' not found")
             else:
@@ -350,9 +393,7 @@ class RcloneBackend(BackendBase):
         Returns:
             Tuple of (success: bool, error_message: str)
         """
-        cmd = ["rclone", "mkdir", f"{remote}:{path}"]
-        if config_path:
-            cmd.extend(["--config", config_path])
+        cmd = _rclone_cmd("mkdir", f"{remote}:{path}", config_path=config_path)
 
         try:
             result = run_command(cmd, "Creating remote directory", timeout=60, check=False)
@@ -378,7 +419,7 @@ class RcloneBackend(BackendBase):
         typer.echo("")
 
         # Step 1: Check if rclone is installed
-        if not shutil.which("rclone"):
+        if not DependencyHelper.exists("rclone"):
             typer.secho("ERROR: rclone is not installed!", fg=typer.colors.RED, bold=True)
             typer.echo("")
             typer.echo("Please install rclone first:")
@@ -416,7 +457,7 @@ class RcloneBackend(BackendBase):
             typer.echo("     sudo -E kopi-docka advanced config new")
             typer.echo("")
             typer.echo("  2. Make config readable by root:")
-            sudo_user_path = sudo_user_home_path(".config/rclone/rclone.conf")
+            sudo_user_path = sudo_user_home_path(RCLONE_CONFIG_SUBPATH)
             if sudo_user_path:
                 typer.echo(f"     chmod 644 {sudo_user_path}")
             typer.echo("     sudo kopi-docka advanced config new")
@@ -460,6 +501,7 @@ class RcloneBackend(BackendBase):
 
                 try:
                     run_command(["rclone", "config"], "Running rclone config", show_output=True)
+                    self._remotes_cache.clear()
                     # Re-check for config after creation
                     rclone_config = self._detect_rclone_config_path()
                     if not rclone_config:
@@ -478,19 +520,12 @@ class RcloneBackend(BackendBase):
 
         # Step 3: Get rclone remote name
         typer.echo("Available remotes (from your rclone config):")
-        list_cmd = ["rclone", "listremotes"]
-        if rclone_config:
-            list_cmd.extend(["--config", rclone_config])
-
-        try:
-            result = run_command(list_cmd, "Listing rclone remotes", timeout=10, check=False)
-            if result.returncode == 0 and result.stdout.strip():
-                for remote_line in result.stdout.strip().split("\n"):
-                    typer.echo(f"  - {remote_line}")
-            else:
-                typer.secho("  (No remotes configured)", fg=typer.colors.YELLOW)
-        except Exception:
-            pass
+        remotes = self._list_remotes(rclone_config)
+        if remotes:
+            for remote_name, remote_type in remotes.items():
+                typer.echo(f"  - {remote_name}: ({remote_type})")
+        else:
+            typer.secho("  (No remotes configured)", fg=typer.colors.YELLOW)
 
         typer.echo("")
         remote = (
@@ -501,6 +536,14 @@ class RcloneBackend(BackendBase):
             typer.secho("Remote name cannot be empty!", fg=typer.colors.RED)
             raise SystemExit(1)
 
+        # Typo check against the listing above (cached, no extra rclone call)
+        if remotes and remote not in remotes:
+            typer.secho(
+                f"⚠ Remote '{remote}' is not in your rclone config "
+                f"(known: {', '.join(remotes)})",
+                fg=typer.colors.YELLOW,
+            )
+
         # Get remote path with hostname-based default
         default_remote_path = get_default_remote_path()
         remote_path = (
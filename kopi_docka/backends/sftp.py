@@ -9,6 +9,8 @@ and persists a ``[credentials]`` block compatible with
 ``advanced config repair-kopia-params``.
 """
 
+import re
+import shlex
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -111,9 +113,6 @@ Test connection:
 
     def get_status(self) -> dict:
         """Get SFTP storage status from canonical kopia_params shape."""
-        import shlex
-        import re
-
         status = {
             "repository_type": self.name,
             "configured": bool(self.config),
@@ -264,7 +263,5 @@ Test connection:
 
     def get_kopia_args(self) -> list:
         """Get Kopia arguments from kopia_params."""
-        import shlex
-
         kopia_params = self.config.get("kopia_params", "")
         return shlex.split(kopia_params) if kopia_params else []
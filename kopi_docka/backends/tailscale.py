@@ -36,6 +36,63 @@ from ..helpers.ui_utils import run_command, SubprocessError
 logger = get_logger(__name__)
 
 
+# Markdown for get_recovery_instructions(); parsed once at import
+_RECOVERY_TEMPLATE = """
+## {display_name} Recovery
+
+**Peer:** `{host}`
+**Remote Path:** `{remote_path}`
+
+### Recovery Steps:
+
+1. **Install and start Tailscale**
+   ```bash
+   curl -fsSL https://tailscale.com/install.sh | sh
+   sudo tailscale up
+   ```
+
+2. **Restore SSH key**
+   ```bash
+   # Copy SSH key from recovery bundle
+   cp credentials/ssh-keys/kopi-docka_ed25519 ~/.ssh/
+   chmod 600 ~/.ssh/kopi-docka_ed25519
+   ```
+
+3. **Test connection to peer**
+   ```bash
+   tailscale ping {hostname}
+   ssh -i ~/.ssh/kopi-docka_ed25519 {ssh_user}@{host}
+   ```
+
+4. **Install Kopia**
+   ```bash
+   # See: https://kopia.io/docs/installation/
+   ```
+
+5. **Connect to repository**
+   ```bash
+   kopia repository connect sftp \\
+     --path sftp://{ssh_user}@{host}:{remote_path} \\
+     --sftp-key-file ~/.ssh/kopi-docka_ed25519
+   ```
+
+6. **List snapshots**
+   ```bash
+   kopia snapshot list
+   ```
+
+7. **Restore data**
+   ```bash
+   kopi-docka restore
+   ```
+
+### Notes:
+- Ensure you're logged into the same Tailnet
+- The backup peer must be online
+- SSH key must have correct permissions (600)
+"""
+
+
 @dataclass
 class TailscalePeer:
     """Tailscale peer information.
@@ -139,18 +196,20 @@ class TailscaleBackend(BackendBase):
 
         lang = get_current_language()
 
-        # Check if Tailscale is running
-        if not self._is_running():
+        # One `tailscale status --json` answers both "running?" and "which peers?"
+        ts_status = self._get_status()
+        if not self._is_running(ts_status):
             utils.print_warning(t("tailscale.not_connected", lang))
 
             if utils.prompt_confirm(t("tailscale.connect_prompt", lang)):
                 self._start_tailscale()
+                ts_status = None  # re-read after `tailscale up`
             else:
                 raise ConfigurationError(_("Tailscale must be running"))
 
         # Discover peers with spinner
         utils.print_info(t("tailscale.loading_peers", lang))
-        peers = self._list_peers()
+        peers = self._list_peers(ts_status)
 
         if not peers:
             utils.print_error(t("tailscale.no_peers", lang))
@@ -484,43 +543,55 @@ class TailscaleBackend(BackendBase):
 
     # Tailscale-specific helpers
 
-    def _is_running(self) -> bool:
-        """Check if Tailscale is running"""
+    def _get_status(self) -> Dict[str, Any]:
+        """Parsed `tailscale status --json` (empty dict if unavailable)"""
         try:
             result = run_command(
-                ["tailscale", "status"],
+                ["tailscale", "status", "--json"],
                 "Checking Tailscale status",
                 timeout=10,
                 check=False,
             )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+            if result.returncode != 0:
+                return {}
+            return json.loads(result.stdout) or {}
+        except (OSError, ValueError, SubprocessError) as e:
+            logger.debug(f"Tailscale status check failed: {e}")
+            return {}
+
+    def _is_running(self, status: Optional[Dict[str, Any]] = None) -> bool:
+        """Check if Tailscale is running"""
+        if status is None:
+            status = self._get_status()
+        return status.get("BackendState") == "Running"
 
     def _start_tailscale(self) -> bool:
         """Start Tailscale"""
         from kopi_docka.helpers import ui_utils as utils
 
         try:
-            run_command(["sudo", "tailscale", "up"], "Starting Tailscale", timeout=30)
+            # Live output: `tailscale up` prints the login URL and then waits
+            # for the browser auth — with a captured spinner it only showed
+            # up after the timeout.
+            run_command(
+                ["sudo", "tailscale", "up"],
+                "Starting Tailscale",
+                timeout=30,
+                show_output=True,
+            )
             utils.print_success("Tailscale started")
             return True
-        except SubprocessError:
+        except (SubprocessError, subprocess.TimeoutExpired):
             utils.print_error("Failed to start Tailscale")
             return False
 
-    def _list_peers(self) -> List[TailscalePeer]:
+    def _list_peers(self, status: Optional[Dict[str, Any]] = None) -> List[TailscalePeer]:
         """List peers in Tailnet with enriched info"""
         try:
-            result = run_command(
-                ["tailscale", "status", "--json"],
-                "Getting peer list",
-                timeout=10,
-            )
-            data = json.loads(result.stdout)
+            data = status if status is not None else self._get_status()
 
             peers = []
-            for peer_id, peer_info in data.get("Peer", {}).items():
+            for peer_id, peer_info in (data.get("Peer") or {}).items():
                 hostname = peer_info.get("HostName", "unknown")
                 # `tailscale status --json` returns DNSName with a trailing
                 # dot, e.g. "tzero-server.beetal-vega.ts.net." — strip it so
@@ -972,57 +1043,10 @@ class TailscaleBackend(BackendBase):
         ssh_user = creds.get("ssh_user", "root")
         remote_path = creds.get("remote_path", "/backup/kopi-docka")
 
-        return f"""
-## {self.display_name} Recovery
-
-**Peer:** `{host}`
-**Remote Path:** `{remote_path}`
-
-### Recovery Steps:
-
-1. **Install and start Tailscale**
-   ```bash
-   curl -fsSL https://tailscale.com/install.sh | sh
-   sudo tailscale up
-   ```
-
-2. **Restore SSH key**
-   ```bash
-   # Copy SSH key from recovery bundle
-   cp credentials/ssh-keys/kopi-docka_ed25519 ~/.ssh/
-   chmod 600 ~/.ssh/kopi-docka_ed25519
-   ```
-
-3. **Test connection to peer**
-   ```bash
-   tailscale ping {hostname}
-   ssh -i ~/.ssh/kopi-docka_ed25519 {ssh_user}@{host}
-   ```
-
-4. **Install Kopia**
-   ```bash
-   # See: https://kopia.io/docs/installation/
-   ```
-
-5. **Connect to repository**
-   ```bash
-   kopia repository connect sftp \\
-     --path sftp://{ssh_user}@{host}:{remote_path} \\
-     --sftp-key-file ~/.ssh/kopi-docka_ed25519
-   ```
-
-6. **List snapshots**
-   ```bash
-   kopia snapshot list
-   ```
-
-7. **Restore data**
-   ```bash
-   kopi-docka restore
-   ```
-
-### Notes:
-- Ensure you're logged into the same Tailnet
-- The backup peer must be online
-- SSH key must have correct permissions (600)
-"""
+        return _RECOVERY_TEMPLATE.format(
+            display_name=self.display_name,
+            host=host,
+            hostname=hostname,
+            ssh_user=ssh_user,
+            remote_path=remote_path,
+        )
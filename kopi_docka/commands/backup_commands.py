@@ -37,8 +37,6 @@ from ..helpers.ui_utils import (
 from ..cores import (
     KopiaRepository,
     DockerDiscovery,
-    BackupManager,
-    RestoreManager,
     DryRunReport,
 )
 
@@ -315,6 +313,10 @@ def _run_backup(
             report.generate(selected, update_recovery_bundle)
             return
 
+        # Imported here: backup/restore managers are only needed by the
+        # commands that run them, not for CLI registration or --help
+        from ..cores.backup_manager import BackupManager
+
         bm = BackupManager(cfg)
         overall_ok = True
 
@@ -388,6 +390,8 @@ def cmd_restore(
     cfg = ensure_config(ctx)
     ensure_repository(ctx)  # Validates repository connection
 
+    from ..cores.restore_manager import RestoreManager
+
     try:
         rm = RestoreManager(
             cfg,
@@ -426,6 +430,8 @@ def cmd_show_docker_config(
     cfg = ensure_config(ctx)
     ensure_repository(ctx)  # Validates repository connection
 
+    from ..cores.restore_manager import RestoreManager
+
     try:
         rm = RestoreManager(cfg)
         success = rm.show_docker_config(snapshot_id)
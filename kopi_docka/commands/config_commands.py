@@ -44,30 +44,22 @@ from ..helpers.ui_utils import (
     prompt_confirm,
     run_command,
 )
-from ..backends.local import LocalBackend
-from ..backends.s3 import S3Backend
-from ..backends.b2 import B2Backend
-from ..backends.azure import AzureBackend
-from ..backends.gcs import GCSBackend
-from ..backends.sftp import SFTPBackend
-from ..backends.tailscale import TailscaleBackend
-from ..backends.rclone import RcloneBackend
+from ..backends import BACKEND_TYPES, get_backend_class
 
 logger = get_logger(__name__)
 console = Console()
 
-# Storage backend registry - maps repository types to their setup/status classes
-# Used by cmd_new_config() for interactive setup and cmd_status() for status display
-BACKEND_MODULES = {
-    "filesystem": LocalBackend,
-    "s3": S3Backend,
-    "b2": B2Backend,
-    "azure": AzureBackend,
-    "gcs": GCSBackend,
-    "sftp": SFTPBackend,
-    "tailscale": TailscaleBackend,
-    "rclone": RcloneBackend,
-}
+# Repository type menu of the config wizard; menu number = position + 1
+_BACKEND_MENU = (
+    ("filesystem", "Local Filesystem  - Store on local disk/NAS mount"),
+    ("s3", "AWS S3           - Amazon S3 or compatible (Wasabi, MinIO)"),
+    ("b2", "Backblaze B2     - Cost-effective cloud storage"),
+    ("azure", "Azure Blob       - Microsoft Azure storage"),
+    ("gcs", "Google Cloud     - GCS storage"),
+    ("sftp", "SFTP             - Remote server via SSH"),
+    ("tailscale", "Tailscale        - P2P encrypted network"),
+    ("rclone", "Rclone           - Universal (70+ cloud providers)"),
+)
 
 
 def get_config(ctx: typer.Context) -> Optional[Config]:
@@ -257,37 +249,23 @@ def cmd_new_config(
     # ═══════════════════════════════════════════
     print_menu(
         "Repository Storage",
-        [
-            ("1", "Local Filesystem  - Store on local disk/NAS mount"),
-            ("2", "AWS S3           - Amazon S3 or compatible (Wasabi, MinIO)"),
-            ("3", "Backblaze B2     - Cost-effective cloud storage"),
-            ("4", "Azure Blob       - Microsoft Azure storage"),
-            ("5", "Google Cloud     - GCS storage"),
-            ("6", "SFTP             - Remote server via SSH"),
-            ("7", "Tailscale        - P2P encrypted network"),
-            ("8", "Rclone           - Universal (70+ cloud providers)"),
-        ],
+        [(str(number), label) for number, (_, label) in enumerate(_BACKEND_MENU, 1)],
     )
 
-    backend_choice = int(console.input("[cyan]Select repository type [1]:[/cyan] ") or "1")
-
-    backend_map = {
-        1: "filesystem",
-        2: "s3",
-        3: "b2",
-        4: "azure",
-        5: "gcs",
-        6: "sftp",
-        7: "tailscale",
-        8: "rclone",
-    }
+    backend_choice = console.input("[cyan]Select repository type [1]:[/cyan] ") or "1"
+    try:
+        backend_index = int(backend_choice) - 1
+    except ValueError:
+        backend_index = 0
+    if not 0 <= backend_index < len(_BACKEND_MENU):
+        backend_index = 0
 
-    backend_type = backend_map.get(backend_choice, "filesystem")
+    backend_type = _BACKEND_MENU[backend_index][0]
     print_success(f"Selected: {backend_type}")
     console.print()
 
     # Use backend class for configuration
-    backend_class = BACKEND_MODULES.get(backend_type)
+    backend_class = get_backend_class(backend_type)
 
     if backend_class:
         backend = backend_class({})
@@ -993,12 +971,12 @@ def cmd_repair_kopia_params(
         raise typer.Exit(code=1)
 
     backend_name = detect_repository_type(current)
-    backend_cls = BACKEND_MODULES.get(backend_name)
+    backend_cls = get_backend_class(backend_name)
     if backend_cls is None:
         print_error_panel(
             f"Unknown backend [bold]{backend_name}[/bold] in kopia_params.\n\n"
             f"[dim]The first token of kopia_params should be one of: "
-            f"{', '.join(sorted(BACKEND_MODULES))}.[/dim]"
+            f"{', '.join(sorted(BACKEND_TYPES))}.[/dim]"
         )
         raise typer.Exit(code=1)
 
@@ -1087,7 +1065,7 @@ def cmd_status(ctx: typer.Context):
     console.print(f"\n[bold cyan]Repository Type:[/bold cyan] {backend_type}")
 
     # Get backend class
-    backend_class = BACKEND_MODULES.get(backend_type)
+    backend_class = get_backend_class(backend_type)
     if not backend_class:
         console.print(f"[red]❌ Repository type '{backend_type}' not available[/red]\n")
         raise typer.Exit(code=1)
@@ -79,7 +79,7 @@ def cmd_check(
                 if verbose:
                     snapshots = repo.list_snapshots()
                     console.print(f"  [cyan]Snapshots:[/cyan] {len(snapshots)}")
-                    units = repo.list_backup_units()
+                    units = repo.list_backup_units(snapshots)
                     console.print(f"  [cyan]Backup units:[/cyan] {len(units)}")
             else:
                 print_error("Kopia repository not connected")
@@ -17,7 +17,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 import typer
 from rich.console import Console
@@ -25,11 +25,10 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..helpers import Config, get_logger
-from ..cores.disaster_recovery_manager import (
-    DisasterRecoveryManager,
-    generate_passphrase,
-    sha256_file,
-)
+
+if TYPE_CHECKING:
+    # The manager pulls in pyzipper/tarfile; only the DR commands import it
+    from ..cores.disaster_recovery_manager import DisasterRecoveryManager
 
 logger = get_logger(__name__)
 console = Console()
@@ -37,7 +36,7 @@ console = Console()
 
 def _print_external_secrets_panel(
     console: Console,
-    manager: DisasterRecoveryManager,
+    manager: "DisasterRecoveryManager",
     ssh_key_embedded: bool = False,
 ) -> None:
     """For SFTP/cloud backends, print a second panel after the "Bundle
@@ -79,6 +78,8 @@ def _print_external_secrets_panel(
                 f"[bold]Key embedded from:[/bold] [cyan]{keyfile}[/cyan]"
             )
         else:
+            from ..cores.disaster_recovery_manager import sha256_file
+
             sha = sha256_file(Path(keyfile)) if keyfile else None
             body = (
                 "[bold]This bundle does NOT contain your SSH private key.[/bold]\n"
@@ -197,6 +198,8 @@ def cmd_disaster_recovery(
     )
     console.print()
 
+    from ..cores.disaster_recovery_manager import DisasterRecoveryManager
+
     try:
         manager = DisasterRecoveryManager(cfg)
 
@@ -286,6 +289,11 @@ def cmd_disaster_recovery_export(
         )
         raise typer.Exit(code=1)
 
+    from ..cores.disaster_recovery_manager import (
+        DisasterRecoveryManager,
+        generate_passphrase,
+    )
+
     cfg = ensure_config(ctx)
     manager = DisasterRecoveryManager(cfg)
 
@@ -34,6 +34,7 @@ from pathlib import Path
 from typing import Optional
 import os
 import platform
+import re
 
 import typer
 from rich.console import Console
@@ -142,8 +143,6 @@ def _check_kopia_params_sanity(kopia_params: str) -> list:
 
     See: Plan 0029 (kopi-docka v7.4.0 changelog).
     """
-    import re
-
     issues = []
     params = (kopia_params or "").strip()
     if not params:
@@ -866,15 +865,16 @@ def cmd_doctor(ctx: typer.Context, verbose: bool = False):
                 repo_table.add_row("Profile", "", repo.profile_name)
 
                 # Get snapshot count
+                snapshots = None
                 try:
                     snapshots = repo.list_snapshots()
                     repo_table.add_row("Snapshots", "", str(len(snapshots)))
                 except Exception:
                     repo_table.add_row("Snapshots", "[yellow]Unknown[/yellow]", "")
 
-                # Get backup units count
+                # Get backup units count (reuses the snapshot list above)
                 try:
-                    units = repo.list_backup_units()
+                    units = repo.list_backup_units(snapshots)
                     repo_table.add_row("Backup Units", "", str(len(units)))
                 except Exception:
                     repo_table.add_row("Backup Units", "[yellow]Unknown[/yellow]", "")
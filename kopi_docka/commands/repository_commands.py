@@ -29,6 +29,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 from rich import box
 
 from ..helpers import (
@@ -49,6 +50,7 @@ from ..helpers.ui_utils import (
 )
 import getpass
 from ..cores import KopiaRepository
+from ..cores.repository_manager import filesystem_repo_cmd
 
 logger = get_logger(__name__)
 console = Console()
@@ -125,6 +127,23 @@ def _override_config(ctx: typer.Context, config_path: Optional[Path]):
         raise typer.Exit(code=1)
 
 
+# Error paths show at most the tail of kopia's output; a looping backend
+# error can otherwise scroll megabytes through the terminal.
+_KOPIA_ERROR_TAIL = 8192
+
+
+def _print_kopia_error(text: str) -> None:
+    """Print kopia output verbatim: no Rich markup/highlight pass, tail only.
+
+    Kopia messages contain brackets (JSON, "[storage]" prefixes) that Rich
+    would otherwise try to parse as markup.
+    """
+    text = text.strip()
+    if len(text) > _KOPIA_ERROR_TAIL:
+        text = "…" + text[-_KOPIA_ERROR_TAIL:]
+    console.print(text, style="dim", markup=False, highlight=False)
+
+
 def _print_kopia_native_status(repo: KopiaRepository) -> None:
     """Print Kopia native status with raw output."""
     console.print()
@@ -161,12 +180,12 @@ def _print_kopia_native_status(repo: KopiaRepository) -> None:
     debug_table.add_column("Property", style="dim")
     debug_table.add_column("Value")
 
-    debug_table.add_row("Command used", " ".join(used_cmd))
-    debug_table.add_row("Config file", cfg_file)
+    debug_table.add_row("Command used", Text(" ".join(used_cmd)))
+    debug_table.add_row("Config file", Text(cfg_file))
     debug_table.add_row(
         "KOPIA_PASSWORD", "[green]set[/green]" if env.get("KOPIA_PASSWORD") else "[red]unset[/red]"
     )
-    debug_table.add_row("KOPIA_CACHE", env.get("KOPIA_CACHE_DIRECTORY") or "-")
+    debug_table.add_row("KOPIA_CACHE", Text(env.get("KOPIA_CACHE_DIRECTORY") or "-"))
     debug_table.add_row(
         "Connected (by RC)", "[green]Yes[/green]" if rc_connected else "[red]No[/red]"
     )
@@ -176,11 +195,14 @@ def _print_kopia_native_status(repo: KopiaRepository) -> None:
     # Output panel
     console.print()
     console.print("[dim]--- kopia stdout ---[/dim]")
-    console.print(raw_out.strip() or "[dim]<empty>[/dim]")
+    if raw_out.strip():
+        console.print(raw_out.strip(), markup=False, highlight=False)
+    else:
+        console.print("[dim]<empty>[/dim]")
     if raw_err.strip():
         console.print()
         console.print("[dim]--- kopia stderr ---[/dim]")
-        console.print(f"[yellow]{raw_err.strip()}[/yellow]")
+        console.print(raw_err.strip(), style="yellow", markup=False, highlight=False)
 
     # Pretty-print JSON if possible
     try:
@@ -188,7 +210,7 @@ def _print_kopia_native_status(repo: KopiaRepository) -> None:
         if parsed is not None:
             console.print()
             console.print("[dim]--- parsed JSON (pretty) ---[/dim]")
-            console.print(json.dumps(parsed, indent=2, ensure_ascii=False))
+            console.print(json.dumps(parsed, indent=2, ensure_ascii=False), markup=False)
     except Exception:
         pass
 
@@ -633,7 +655,7 @@ def cmd_repo_status(ctx: typer.Context, config: Optional[Path] = None):
 
         # Get statistics
         snapshots = repo.list_snapshots()
-        units = repo.list_backup_units()
+        units = repo.list_backup_units(snapshots)
 
         console.print("\n[bold]KOPIA REPOSITORY STATUS[/bold]\n")
         # Build status table
@@ -647,8 +669,9 @@ def cmd_repo_status(ctx: typer.Context, config: Optional[Path] = None):
         table.add_column("Property", style="cyan")
         table.add_column("Value")
 
-        table.add_row("Profile", str(repo.profile_name))
-        table.add_row("Kopia Params", str(getattr(repo, "kopia_params", "")))
+        # User-supplied values go in as Text: printed verbatim, no markup pass
+        table.add_row("Profile", Text(str(repo.profile_name)))
+        table.add_row("Kopia Params", Text(str(getattr(repo, "kopia_params", ""))))
         table.add_row("Connected", "[green]Yes[/green]" if is_conn else "[red]No[/red]")
         table.add_row("Total Snapshots", str(len(snapshots)))
         table.add_row("Backup Units", str(len(units)))
@@ -675,9 +698,11 @@ def cmd_repo_which_config(ctx: typer.Context, config: Optional[Path] = None):
     table.add_column("Property", style="cyan")
     table.add_column("Value")
 
-    table.add_row("Profile", repo.profile_name)
-    table.add_row("Profile config", repo._get_config_file())
-    table.add_row("Default config", str(Path.home() / ".config" / "kopia" / "repository.config"))
+    table.add_row("Profile", Text(str(repo.profile_name)))
+    table.add_row("Profile config", Text(str(repo._get_config_file())))
+    table.add_row(
+        "Default config", Text(str(Path.home() / ".config" / "kopia" / "repository.config"))
+    )
 
     console.print()
     console.print(table)
@@ -747,31 +772,19 @@ def cmd_repo_init_path(
 
     # Create
     cmd_create = [
-        "kopia",
-        "repository",
-        "create",
-        "filesystem",
-        "--path",
-        str(path),
-        "--description",
-        f"Kopi-Docka Backup Repository ({profile or repo.profile_name})",
+        *filesystem_repo_cmd("create", path, profile or repo.profile_name),
         "--config-file",
         cfg_file,
     ]
     p = run_command(cmd_create, "Creating repository", check=False, env=env)
     if p.returncode != 0 and "existing data in storage location" not in (p.stderr or ""):
         print_error("Create failed:")
-        console.print(f"[dim]{p.stderr.strip() or p.stdout.strip()}[/dim]")
+        _print_kopia_error(p.stderr.strip() or p.stdout.strip())
         raise typer.Exit(code=1)
 
     # Connect
     cmd_connect = [
-        "kopia",
-        "repository",
-        "connect",
-        "filesystem",
-        "--path",
-        str(path),
+        *filesystem_repo_cmd("connect", path, profile or repo.profile_name),
         "--config-file",
         cfg_file,
     ]
@@ -784,8 +797,8 @@ def cmd_repo_init_path(
             env=env,
         )
         print_error("Connect failed:")
-        console.print(
-            f"[dim]{pc.stderr.strip() or pc.stdout.strip() or ps.stderr.strip() or ps.stdout.strip()}[/dim]"
+        _print_kopia_error(
+            pc.stderr.strip() or pc.stdout.strip() or ps.stderr.strip() or ps.stdout.strip()
         )
         raise typer.Exit(code=1)
 
@@ -798,7 +811,7 @@ def cmd_repo_init_path(
     )
     if ps.returncode != 0:
         print_error("Status failed after connect:")
-        console.print(f"[dim]{ps.stderr.strip() or ps.stdout.strip()}[/dim]")
+        _print_kopia_error(ps.stderr.strip() or ps.stdout.strip())
         raise typer.Exit(code=1)
 
     print_success("Repository created & connected")
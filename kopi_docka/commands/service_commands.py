@@ -31,6 +31,9 @@ from ..cores import KopiDockaService, ServiceConfig, write_systemd_units, Servic
 logger = get_logger(__name__)
 console = Console()
 
+# Preset backup times of the timer menu: menu key -> HH:MM (first one is the default)
+_TIMER_PRESETS = {"1": "02:00", "2": "03:00", "3": "04:00", "4": "23:00"}
+
 
 # -------------------------
 # Helper Functions
@@ -348,10 +351,8 @@ def _configure_timer(helper: ServiceHelper):
         console.print()
 
     while True:
-        console.print("[1] 02:00 (Default)")
-        console.print("[2] 03:00")
-        console.print("[3] 04:00")
-        console.print("[4] 23:00")
+        for key, hhmm in _TIMER_PRESETS.items():
+            console.print(f"[{key}] {hhmm}" + (" (Default)" if key == "1" else ""))
         console.print("[5] Custom Time (HH:MM)")
         console.print("[6] Advanced (OnCalendar)")
         console.print("[0] Back")
@@ -363,14 +364,8 @@ def _configure_timer(helper: ServiceHelper):
 
         if choice == "0":
             break
-        elif choice == "1":
-            new_schedule = "*-*-* 02:00:00"
-        elif choice == "2":
-            new_schedule = "*-*-* 03:00:00"
-        elif choice == "3":
-            new_schedule = "*-*-* 04:00:00"
-        elif choice == "4":
-            new_schedule = "*-*-* 23:00:00"
+        elif choice in _TIMER_PRESETS:
+            new_schedule = f"*-*-* {_TIMER_PRESETS[choice]}:00"
         elif choice == "5":
             # Custom time input
             time_input = console.input("[cyan]Enter time (HH:MM):[/cyan] ").strip()
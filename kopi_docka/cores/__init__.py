@@ -15,22 +15,43 @@
 
 """Core business logic modules for Kopi-Docka."""
 
-from .backup_manager import BackupManager
-from .restore_manager import RestoreManager
-from .docker_discovery import DockerDiscovery
-from .repository_manager import KopiaRepository
-from .dependency_manager import DependencyManager
-from .dry_run_manager import DryRunReport
-from .disaster_recovery_manager import DisasterRecoveryManager
-from .service_manager import (
-    KopiDockaService,
-    ServiceConfig,
-    write_systemd_units,  # ← Diese Zeile hinzufügen
-)
-from .service_helper import ServiceHelper
-from .kopia_policy_manager import KopiaPolicyManager
-from .notification_manager import NotificationManager, BackupStats
-from .snapshot_manager import SnapshotManager
+import importlib
+
+# Public names resolved on first attribute access (PEP 562). Every command
+# module does "from ..cores import X" at import time, and the CLI imports all
+# command modules to register them - so an eager import here loaded every
+# manager (restore, backup, disaster recovery, ...) even for "--help".
+_LAZY_EXPORTS = {
+    "BackupManager": ".backup_manager",
+    "RestoreManager": ".restore_manager",
+    "DockerDiscovery": ".docker_discovery",
+    "KopiaRepository": ".repository_manager",
+    "DependencyManager": ".dependency_manager",
+    "DryRunReport": ".dry_run_manager",
+    "DisasterRecoveryManager": ".disaster_recovery_manager",
+    "KopiDockaService": ".service_manager",
+    "ServiceConfig": ".service_manager",
+    "write_systemd_units": ".service_manager",
+    "ServiceHelper": ".service_helper",
+    "KopiaPolicyManager": ".kopia_policy_manager",
+    "NotificationManager": ".notification_manager",
+    "BackupStats": ".notification_manager",
+    "SnapshotManager": ".snapshot_manager",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BackupManager",
@@ -42,7 +63,7 @@ __all__ = [
     "DisasterRecoveryManager",
     "KopiDockaService",
     "ServiceConfig",
-    "write_systemd_units",  # ← Diese Zeile hinzufügen
+    "write_systemd_units",
     "ServiceHelper",
     "KopiaPolicyManager",
     "NotificationManager",
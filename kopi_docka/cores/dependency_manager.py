@@ -427,8 +427,10 @@ class DependencyManager:
         Returns:
             Dictionary with all dependency requirements
         """
+        # Probe once; derive "missing" from the same status
+        status = self.check_all(include_optional=True)
         return {
             "dependencies": self.dependencies,
-            "status": self.check_all(include_optional=True),
-            "missing": self.get_missing(required_only=False),
+            "status": status,
+            "missing": [name for name, installed in status.items() if not installed],
         }
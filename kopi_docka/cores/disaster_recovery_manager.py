@@ -30,6 +30,7 @@ from __future__ import annotations
 import io
 import json
 import hashlib
+import os
 import re
 import socket
 import sys
@@ -47,7 +48,11 @@ from ..helpers.config import Config
 from ..helpers.sudo_helper import chown_to_sudo_user, sudo_user_home_path
 from ..helpers.ui_utils import run_command
 from ..cores.repository_manager import KopiaRepository
-from ..helpers.constants import VERSION
+from ..helpers.constants import (
+    RCLONE_CONFIG_SUBPATH,
+    ROOT_RCLONE_CONFIG,
+    VERSION,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -136,6 +141,18 @@ def sha256_file(path: Path) -> Optional[str]:
         return None
 
 
+# Kopia storage type → the one config field recover.sh needs to reconnect.
+# sftp carries several fields and is handled in _extract_repo_from_status().
+_STORAGE_CONNECT_FIELD = {
+    "filesystem": "path",
+    "s3": "bucket",
+    "b2": "bucket",
+    "azure": "container",
+    "gcs": "bucket",
+    "rclone": "remotePath",
+}
+
+
 class DisasterRecoveryManager:
     """
     Creates and manages disaster recovery bundles.
@@ -160,6 +177,8 @@ class DisasterRecoveryManager:
     def __init__(self, config: Config):
         self.config = config
         self.repo = KopiaRepository(config)
+        # (path,) once _find_rclone_config() has run; None = not resolved yet
+        self._rclone_config_cache: Optional[Tuple[Optional[Path]]] = None
 
     def create_recovery_bundle(
         self,
@@ -222,7 +241,7 @@ class DisasterRecoveryManager:
 
             # 3.5) rclone.conf (if using rclone backend)
             rclone_conf_path = self._find_rclone_config()
-            if rclone_conf_path and rclone_conf_path.exists():
+            if rclone_conf_path:
                 import shutil
 
                 shutil.copy(rclone_conf_path, work_dir / "rclone.conf")
@@ -334,7 +353,7 @@ class DisasterRecoveryManager:
 
             # 4) rclone.conf (if applicable)
             rclone_conf = self._find_rclone_config()
-            if rclone_conf and rclone_conf.exists():
+            if rclone_conf:
                 zf.write(str(rclone_conf), "rclone.conf")
 
             # 4a) ssh-key/ (opt-in for SFTP — recover.sh consumes it if present)
@@ -622,9 +641,20 @@ class DisasterRecoveryManager:
         """
         Find rclone.conf path from config or fallback locations.
 
+        The lookup is done once per manager: a bundle export asks for the
+        path from several steps and the answer does not change in between.
+
         Returns:
             Path to rclone.conf if found, None otherwise
         """
+        cached = self._rclone_config_cache
+        if cached is None:
+            cached = (self._locate_rclone_config(),)
+            self._rclone_config_cache = cached
+        return cached[0]
+
+    def _locate_rclone_config(self) -> Optional[Path]:
+        """Probe kopia_params and the standard locations for rclone.conf."""
         # 1. Check kopia_params for --rclone-args='--config=PATH'
         kopia_params = self.config.get("kopia", "kopia_params", fallback="")
         if "--rclone-args=" in kopia_params:
@@ -636,10 +666,11 @@ class DisasterRecoveryManager:
                     return path
 
         # 2. Fallback: Standard locations
-        candidates = [
-            Path("/root/.config/rclone/rclone.conf"),
-        ]
-        user_candidate = sudo_user_home_path(".config/rclone/rclone.conf")
+        candidates = [ROOT_RCLONE_CONFIG]
+        env_config = os.environ.get("RCLONE_CONFIG")
+        if env_config:
+            candidates.insert(0, Path(env_config))
+        user_candidate = sudo_user_home_path(RCLONE_CONFIG_SUBPATH)
         if user_candidate is not None:
             candidates.append(user_candidate)
 
@@ -710,28 +741,11 @@ class DisasterRecoveryManager:
         storage_type = storage.get("type", "unknown")
         storage_config = storage.get("config", {})
 
-        # Map Kopia storage types to our naming
-        if storage_type == "filesystem":
-            path = storage_config.get("path", "")
-            return "filesystem", {"path": path}
-
-        elif storage_type == "s3":
-            bucket = storage_config.get("bucket", "")
-            return "s3", {"bucket": bucket}
+        field = _STORAGE_CONNECT_FIELD.get(storage_type)
+        if field:
+            return storage_type, {field: storage_config.get(field, "")}
 
-        elif storage_type == "b2":
-            bucket = storage_config.get("bucket", "")
-            return "b2", {"bucket": bucket}
-
-        elif storage_type == "azure":
-            container = storage_config.get("container", "")
-            return "azure", {"container": container}
-
-        elif storage_type == "gcs":
-            bucket = storage_config.get("bucket", "")
-            return "gcs", {"bucket": bucket}
-
-        elif storage_type == "sftp":
+        if storage_type == "sftp":
             # Capture everything recover.sh needs to rebuild a non-interactive
             # `kopia repository connect sftp ...` call. The SSH private key
             # itself stays on the original filesystem — see Plan 0030 / v7.5.1
@@ -745,13 +759,8 @@ class DisasterRecoveryManager:
                 "knownHostsFile": storage_config.get("knownHostsFile", ""),
             }
 
-        elif storage_type == "rclone":
-            remote_path = storage_config.get("remotePath", "")
-            return "rclone", {"remotePath": remote_path}
-
-        else:
-            # Fallback for unknown types
-            return storage_type, storage_config
+        # Fallback for unknown types
+        return storage_type, storage_config
 
     def _export_kopia_config(self, out_dir: Path) -> None:
         try:
@@ -1184,7 +1193,7 @@ Generated by Kopi-Docka v{VERSION}
                 timeout=5,
                 check=False,
             )
-            return (result.stdout or "").strip().split("\n")[0] or "unknown"
+            return (result.stdout or "").strip().partition("\n")[0] or "unknown"
         except Exception:
             return "unknown"
 
@@ -61,6 +61,18 @@ class KopiaCommandError(RuntimeError):
         super().__init__(f"{' '.join(cmd[:3])} failed (rc={returncode}): {stderr_tail[:200]}")
 
 
+def filesystem_repo_cmd(verb: str, repo_dir: Path, profile: str) -> List[str]:
+    """Build ``kopia repository create|connect filesystem`` for an explicit path.
+
+    Shared by KopiaRepository.create_filesystem_repo_at_path() and the
+    repo-init-path command, which bypass kopia_params and point at PATH directly.
+    """
+    cmd = ["kopia", "repository", verb, "filesystem", "--path", str(repo_dir)]
+    if verb == "create":
+        cmd += ["--description", f"Kopi-Docka Backup Repository ({profile})"]
+    return cmd
+
+
 class KopiaRepository:
     """
     Wraps Kopia CLI interactions for a given profile.
@@ -95,15 +107,27 @@ class KopiaRepository:
             )
         self.profile_name = config.kopia_profile
         self._connected_cache: tuple[bool, float] | None = None  # (result, monotonic ts)
+        # Parsed 'repository status --json' from the last successful probe
+        self._status_cache: tuple[Dict[str, Any], float] | None = None  # (status, monotonic ts)
         self._rclone_timeout_patched = False  # one-shot self-healing flag
 
     # --------------- Low-level helpers ---------------
 
     def _get_config_file(self) -> str:
-        """Return profile-specific Kopia config file path."""
+        """Return profile-specific Kopia config file path.
+
+        Every _run() asks for this (once for --config-file, once for the
+        env), so the path is built and its directory created only once per
+        profile instead of per Kopia call.
+        """
+        cached = getattr(self, "_config_file_cache", None)
+        if cached is not None and cached[0] == self.profile_name:
+            return cached[1]
         cfg_dir = Path.home() / ".config" / "kopia"
         cfg_dir.mkdir(parents=True, exist_ok=True)
-        return str(cfg_dir / f"repository-{self.profile_name}.config")
+        cfg_file = str(cfg_dir / f"repository-{self.profile_name}.config")
+        self._config_file_cache = (self.profile_name, cfg_file)
+        return cfg_file
 
     def _current_storage_type(self) -> Optional[str]:
         """Return the storage.type currently recorded in Kopia's connect-config,
@@ -167,6 +191,19 @@ class KopiaRepository:
             return []
         return [f"--rclone-startup-timeout={self.config.kopia_rclone_startup_timeout}"]
 
+    def _repository_cmd(self, verb: str, params: List[str]) -> List[str]:
+        """Build ``kopia repository create|connect`` for the parsed kopia_params.
+
+        create() and connect() share the backend params and rclone args; only
+        the verb-specific flags differ (description vs. cache size limits).
+        """
+        if verb == "create":
+            extra = ["--description", f"Kopi-Docka Backup Repository ({self.profile_name})"]
+        else:
+            # Include cache size limits to prevent unbounded cache growth
+            extra = self._get_cache_params()
+        return ["kopia", "repository", verb, *params, *extra, *self._get_rclone_args()]
+
     def _maybe_cleanup_legacy_state_files(self) -> None:
         """Plan 0028: ``~/.config/kopi-docka/policy_state.json`` was the
         smart-skip hash cache for v7.2.0's per-path policy writes. v7.3.0
@@ -335,6 +372,10 @@ class KopiaRepository:
         Returns dict when json_output=True and JSON parses; otherwise plaintext.
         """
         base = ["kopia", "repository", "status"]
+        if json_output and not verbose:
+            cached = self._fresh_status()
+            if cached is not None:
+                return cached
         if json_output:
             # prefer --json-verbose (newer Kopia), fallback to --json
             args = base + (["--json-verbose"] if verbose else ["--json"])
@@ -351,11 +392,36 @@ class KopiaRepository:
         out = proc.stdout.strip()
         if json_output:
             try:
-                return json.loads(out) if out else {}
+                status = json.loads(out) if out else {}
             except json.JSONDecodeError:
                 return out
+            if not verbose:
+                self._remember_status(status)
+            return status
         return out
 
+    def _remember_status(self, status: Any) -> None:
+        """Keep a successful 'status --json' result; it proves the connection too."""
+        if isinstance(status, dict):
+            now = time.monotonic()
+            self._status_cache = (status, now)
+            self._connected_cache = (True, now)
+
+    def _fresh_status(self) -> Optional[Dict[str, Any]]:
+        """Status from the last probe if younger than _CONNECTED_CACHE_TTL.
+
+        is_connected() and status() run the same 'kopia repository status
+        --json'; on slow backends (rclone/GDrive) each fork costs seconds, so
+        one probe serves both within the TTL.
+        """
+        cached = getattr(self, "_status_cache", None)
+        if cached is None:
+            return None
+        status, ts = cached
+        if time.monotonic() - ts >= self._CONNECTED_CACHE_TTL:
+            return None
+        return dict(status)
+
     def is_connected(self, force_refresh: bool = False) -> bool:
         """True when 'kopia repository status' succeeds for our profile.
 
@@ -378,6 +444,15 @@ class KopiaRepository:
                 logger.debug("is_connected() returning cached result: %s", cached_result)
                 return cached_result
 
+        if not os.path.exists(self._get_config_file()):
+            # No connect-config for this profile yet (fresh install, after
+            # disconnect): kopia could only answer "not connected", so one
+            # stat replaces the status round-trip.
+            logger.debug("is_connected(): no Kopia config for profile %s", self.profile_name)
+            self._connected_cache = (False, now)
+            self._status_cache = None
+            return False
+
         try:
             proc = self._run(
                 ["kopia", "repository", "status", "--json"],
@@ -390,6 +465,13 @@ class KopiaRepository:
             result = False
 
         self._connected_cache = (result, now)
+        if result:
+            try:
+                self._remember_status(json.loads(proc.stdout or "{}"))
+            except (TypeError, ValueError):
+                pass
+        else:
+            self._status_cache = None
         return result
 
     def is_initialized(self) -> bool:
@@ -424,14 +506,7 @@ class KopiaRepository:
                 logger.debug("Skipping policy defaults (optional): %s", e)
             return
 
-        params = shlex.split(self.kopia_params)
-        # Include cache size limits to prevent unbounded cache growth
-        cmd = (
-            ["kopia", "repository", "connect"]
-            + params
-            + self._get_cache_params()
-            + self._get_rclone_args()
-        )
+        cmd = self._repository_cmd("connect", shlex.split(self.kopia_params))
 
         # Try connect
         proc = self._run(cmd, check=False)
@@ -464,10 +539,15 @@ class KopiaRepository:
 
     def disconnect(self) -> None:
         """Disconnect from repository (kopia repository disconnect)."""
+        self._status_cache = None
         try:
             self._run(["kopia", "repository", "disconnect"], check=False)
+            # Known state now: the next is_connected() (e.g. in initialize())
+            # needs no status probe, and never trusts a pre-disconnect True
+            self._connected_cache = (False, time.monotonic())
             logger.info("Disconnected from repository")
         except Exception as e:
+            self._connected_cache = None
             logger.debug(f"Disconnect failed (may not be connected): {e}")
 
     def initialize(self) -> None:
@@ -490,7 +570,6 @@ class KopiaRepository:
                 actual,
             )
             self.disconnect()
-            self.is_connected(force_refresh=True)
 
         # Check if already connected to this repo
         if self.is_connected():
@@ -504,19 +583,8 @@ class KopiaRepository:
             if len(params) >= 3:
                 Path(params[2]).expanduser().mkdir(parents=True, exist_ok=True)
 
-        cmd_create = (
-            ["kopia", "repository", "create"]
-            + params
-            + ["--description", f"Kopi-Docka Backup Repository ({self.profile_name})"]
-            + self._get_rclone_args()
-        )
-        # Include cache size limits to prevent unbounded cache growth
-        cmd_connect = (
-            ["kopia", "repository", "connect"]
-            + params
-            + self._get_cache_params()
-            + self._get_rclone_args()
-        )
+        cmd_create = self._repository_cmd("create", params)
+        cmd_connect = self._repository_cmd("connect", params)
 
         # Try to create (may fail if exists); timeout prevents indefinite hang on
         # unreachable backends or wrong credentials.
@@ -1058,9 +1126,17 @@ class KopiaRepository:
 
     # --------------- Utilities ---------------
 
-    def list_backup_units(self) -> List[Dict[str, Any]]:
-        """Infer backup units from recipe snapshots (tag type=recipe, tag unit=<name>)."""
-        recipe_snaps = self.list_snapshots()
+    def list_backup_units(
+        self, snapshots: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Infer backup units from recipe snapshots (tag type=recipe, tag unit=<name>).
+
+        Args:
+            snapshots: Result of a previous list_snapshots() call. Callers that
+                show snapshot count and units together pass it in to avoid a
+                second 'kopia snapshot list' (slow on cloud backends).
+        """
+        recipe_snaps = self.list_snapshots() if snapshots is None else snapshots
         units: Dict[str, Dict[str, Any]] = {}
         for s in recipe_snaps:
             tags = s.get("tags") or {}
@@ -1106,11 +1182,7 @@ class KopiaRepository:
 
         # 1) Create
         p = self._run(
-            [
-                "kopia", "repository", "create", "filesystem",
-                "--path", str(repo_dir),
-                "--description", f"Kopi-Docka Backup Repository ({prof})",
-            ],
+            filesystem_repo_cmd("create", repo_dir, prof),
             check=False,
             extra_env=pw_env,
             config_file=cfg_file,
@@ -1121,10 +1193,7 @@ class KopiaRepository:
 
         # 2) Connect (idempotent)
         pc = self._run(
-            [
-                "kopia", "repository", "connect", "filesystem",
-                "--path", str(repo_dir),
-            ],
+            filesystem_repo_cmd("connect", repo_dir, prof),
             check=False,
             extra_env=pw_env,
             config_file=cfg_file,
@@ -1175,7 +1244,7 @@ class KopiaRepository:
         if not s:
             return {}
         if "\n" in s:
-            first = s.splitlines()[0].strip()
+            first = s.partition("\n")[0].strip()
             try:
                 return json.loads(first)
             except Exception:
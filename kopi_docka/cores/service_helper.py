@@ -31,6 +31,14 @@ from ..helpers.ui_utils import run_command, SubprocessError
 
 LOGGER = get_logger("kopi_docka.service_helper")
 
+# Custom timer time (HH:MM, hour may be single-digit)
+_HHMM_PATTERN = re.compile(r"^([0-1]?\d|2[0-3]):[0-5]\d$")
+
+# Backup run markers in the service journal (get_last_backup_info)
+_BACKUP_START_PATTERN = re.compile(r"Starting backup|Backup started")
+_BACKUP_SUCCESS_PATTERN = re.compile(r"Backup (finished successfully|completed|success)")
+_BACKUP_FAILED_PATTERN = re.compile(r"Backup (failed|error)")
+
 
 @dataclass
 class ServiceStatus:
@@ -377,27 +385,22 @@ class ServiceHelper:
             status = "unknown"
             duration = None
 
-            # Patterns to match
-            start_pattern = re.compile(r"Starting backup|Backup started")
-            success_pattern = re.compile(r"Backup (finished successfully|completed|success)")
-            failed_pattern = re.compile(r"Backup (failed|error)")
-
             for line in reversed(logs):  # Start from most recent
                 # Extract timestamp from journalctl line
                 # Format: "Dec 21 14:00:00 hostname kopi-docka[12345]: message"
-                parts = line.split()
+                parts = line.split(None, 3)
                 if len(parts) >= 3:
                     timestamp_candidate = " ".join(parts[0:3])
 
-                    if success_pattern.search(line):
+                    if _BACKUP_SUCCESS_PATTERN.search(line):
                         status = "success"
                         timestamp = timestamp_candidate
                         break
-                    elif failed_pattern.search(line):
+                    elif _BACKUP_FAILED_PATTERN.search(line):
                         status = "failed"
                         timestamp = timestamp_candidate
                         break
-                    elif start_pattern.search(line) and timestamp is None:
+                    elif timestamp is None and _BACKUP_START_PATTERN.search(line):
                         timestamp = timestamp_candidate
 
             return BackupInfo(timestamp=timestamp, status=status, duration=duration)
@@ -784,8 +787,7 @@ class ServiceHelper:
         Returns:
             True if valid, False otherwise
         """
-        pattern = r"^([0-1]?\d|2[0-3]):[0-5]\d$"
-        return bool(re.match(pattern, time_str))
+        return bool(_HHMM_PATTERN.match(time_str))
 
     def validate_oncalendar(self, calendar_str: str) -> bool:
         """
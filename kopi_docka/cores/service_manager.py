@@ -58,13 +58,12 @@ from ..helpers.ui_utils import (
 LOGGER = get_logger("kopi_docka.service")
 
 # -------- systemd detection --------
+# Resolved once at import: the notify helpers are also called from
+# SafeExitManager's signal handlers, which must not hit the import machinery.
 try:
-    from systemd import daemon as systemd_daemon  # type: ignore
-
-    HAS_SYSTEMD = True
+    from systemd.daemon import notify as _sd_notify  # type: ignore
 except Exception:  # pragma: no cover - optional dep
-    systemd_daemon = None  # type: ignore
-    HAS_SYSTEMD = False
+    _sd_notify = None
 
 
 # -------- Locking --------
@@ -99,47 +98,37 @@ def _has_notify_socket() -> bool:
     return bool(os.getenv("NOTIFY_SOCKET"))
 
 
-def sd_notify_ready(status: Optional[str] = None) -> None:
-    if not (HAS_SYSTEMD and _has_notify_socket()):
+def _notify(msg: str) -> None:
+    """Send ``msg`` via sd_notify; no-op without systemd-python or NOTIFY_SOCKET."""
+    if _sd_notify is None or not _has_notify_socket():
         return
     try:
-        msg = "READY=1"
-        if status:
-            msg += f"\nSTATUS={status}"
-        systemd_daemon.notify(msg)  # type: ignore[arg-type]
+        _sd_notify(msg)
     except Exception:  # pragma: no cover
         pass
 
 
+def sd_notify_ready(status: Optional[str] = None) -> None:
+    msg = "READY=1"
+    if status:
+        msg += f"\nSTATUS={status}"
+    _notify(msg)
+
+
 def sd_notify_status(status: str) -> None:
-    if not (HAS_SYSTEMD and _has_notify_socket()):
-        return
-    try:
-        systemd_daemon.notify(f"STATUS={status}")  # type: ignore[arg-type]
-    except Exception:  # pragma: no cover
-        pass
+    _notify(f"STATUS={status}")
 
 
 def sd_notify_stopping(status: Optional[str] = None) -> None:
-    if not (HAS_SYSTEMD and _has_notify_socket()):
-        return
-    try:
-        msg = "STOPPING=1"
-        if status:
-            msg += f"\nSTATUS={status}"
-        systemd_daemon.notify(msg)  # type: ignore[arg-type]
-    except Exception:  # pragma: no cover
-        pass
+    msg = "STOPPING=1"
+    if status:
+        msg += f"\nSTATUS={status}"
+    _notify(msg)
 
 
 def sd_notify_watchdog() -> None:
     """Send WATCHDOG=1 wenn Watchdog konfiguriert ist."""
-    if not (HAS_SYSTEMD and _has_notify_socket()):
-        return
-    try:
-        systemd_daemon.notify("WATCHDOG=1")  # type: ignore[arg-type]
-    except Exception:  # pragma: no cover
-        pass
+    _notify("WATCHDOG=1")
 
 
 # -------- Config --------
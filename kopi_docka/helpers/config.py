@@ -22,13 +22,14 @@ Supports secure password storage via password files or direct plaintext.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from pydantic import BaseModel, Field, field_validator, ValidationError
 
@@ -37,6 +38,11 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Valid Kopia repository types (first word of kopia_params)
+_KOPIA_REPOSITORY_TYPES = frozenset(
+    {"filesystem", "rclone", "s3", "b2", "azure", "gcs", "sftp", "webdav"}
+)
+
 
 def detect_repository_type(kopia_params: str) -> str:
     """
@@ -62,17 +68,10 @@ def detect_repository_type(kopia_params: str) -> str:
     if not kopia_params or not kopia_params.strip():
         return "unknown"
 
-    # Split and get first word (the repository type)
-    parts = kopia_params.strip().split()
-    if not parts:
-        return "unknown"
-
-    repo_type = parts[0].lower()
-
-    # Valid Kopia repository types
-    valid_types = {"filesystem", "rclone", "s3", "b2", "azure", "gcs", "sftp", "webdav"}
+    # First word is the repository type
+    repo_type = kopia_params.split(None, 1)[0].lower()
 
-    return repo_type if repo_type in valid_types else "unknown"
+    return repo_type if repo_type in _KOPIA_REPOSITORY_TYPES else "unknown"
 
 
 def extract_filesystem_path(kopia_params: str) -> Optional[str]:
@@ -175,13 +174,12 @@ class KopiaConfig(BaseModel):
             raise ValueError("kopia_params cannot be empty")
 
         # Check if it starts with a valid repository type
-        valid_types = {"filesystem", "rclone", "s3", "b2", "azure", "gcs", "sftp", "webdav"}
-        first_word = v.strip().split()[0].lower()
+        first_word = v.split(None, 1)[0].lower()
 
-        if first_word not in valid_types:
+        if first_word not in _KOPIA_REPOSITORY_TYPES:
             raise ValueError(
                 f"Invalid repository type '{first_word}'. "
-                f"Must be one of: {', '.join(sorted(valid_types))}"
+                f"Must be one of: {', '.join(sorted(_KOPIA_REPOSITORY_TYPES))}"
             )
 
         return v.strip()
@@ -370,6 +368,19 @@ class ConfigModel(BaseModel):
 # Config Class (with Pydantic validation)
 # ===============================================================================
 
+# Validated config per file, keyed by (st_mtime_ns, st_size). A single command
+# often builds several Config objects for the same file (CLI callback, repo
+# commands re-reading after init/password change); this spares the JSON parse
+# and Pydantic validation when the file has not changed in between.
+_LOADED_CONFIGS: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
+
+# Option names masked by Config.display()
+_SENSITIVE_OPTION_PATTERN = re.compile(
+    r"(password|secret|key|token|credential|auth|api_key|client_secret|"
+    r"access_key|private_key|webhook|smtp_pass)",
+    re.IGNORECASE,
+)
+
 
 class Config:
     """
@@ -547,9 +558,11 @@ class Config:
                 shutil.copy2(password_file, backup_file)
                 logger.info(f"Previous password backed up: {backup_file}")
 
-            # Write new password
-            password_file.write_text(password + "\n", encoding="utf-8")
-            password_file.chmod(0o600)
+            # Write new password; created as 0600, never briefly umask-readable
+            fd = os.open(password_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                os.fchmod(f.fileno(), 0o600)  # existing file keeps its old mode otherwise
+                f.write(password + "\n")
             logger.info(f"Password stored in: {password_file}")
 
             # Update config to reference the file
@@ -586,21 +599,20 @@ class Config:
         password_file_str = self.get("kopia", "password_file", fallback="")
         if password_file_str:
             password_file = Path(password_file_str).expanduser()
-            if password_file.exists():
-                try:
-                    pwd = password_file.read_text(encoding="utf-8").strip()
-                    if pwd:
-                        logger.debug(f"Using password from file: {password_file}")
-                        return pwd
-                    else:
-                        raise ValueError(f"Password file is empty: {password_file}")
-                except Exception as e:
-                    raise ValueError(f"Cannot read password file {password_file}: {e}")
-            else:
+            # Called for every kopia command (_get_env): read directly, no exists() stat first
+            try:
+                pwd = password_file.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
                 raise ValueError(
                     f"Password file not found: {password_file}\n"
                     f"Either create the file or remove 'password_file' setting."
                 )
+            except Exception as e:
+                raise ValueError(f"Cannot read password file {password_file}: {e}")
+            if not pwd:
+                raise ValueError(f"Password file is empty: {password_file}")
+            logger.debug(f"Using password from file: {password_file}")
+            return pwd
 
         # PRIORITY 2: Direct password in config (Plaintext - Standard)
         password = self.get("kopia", "password", fallback="")
@@ -706,6 +718,9 @@ class Config:
 
     def save(self) -> None:
         """Save configuration to file atomically with proper permissions."""
+        # Cached parse is stale from here on, even if the save fails halfway
+        _LOADED_CONFIGS.pop(self.config_file, None)
+
         # Atomic save mit temp file
         temp_fd, temp_path = tempfile.mkstemp(
             dir=self.config_file.parent, prefix=".kopi-docka-config-", suffix=".tmp"
@@ -718,12 +733,9 @@ class Config:
                 json.dump(self._config, f, indent=2, ensure_ascii=False)
                 f.write("\n")  # Trailing newline
 
-            # Atomic replace
+            # Atomic replace - the 0600 inode replaces the old file, so no chmod afterwards
             os.replace(temp_path, self.config_file)
 
-            # WICHTIG: Setze Permissions NACH replace hart auf 0600
-            os.chmod(self.config_file, 0o600)
-
             logger.info(f"Configuration saved to {self.config_file}")
 
         except Exception as e:
@@ -745,13 +757,6 @@ class Config:
         print(f"Configuration file: {self.config_file}")
         print("=" * 60)
 
-        # Erweiterte Masking-Patterns mit Regex
-        sensitive_patterns = re.compile(
-            r"(password|secret|key|token|credential|auth|api_key|client_secret|"
-            r"access_key|private_key|webhook|smtp_pass)",
-            re.IGNORECASE,
-        )
-
         for section, options in self._config.items():
             print(f"\n[{section}]")
 
@@ -759,7 +764,7 @@ class Config:
             if isinstance(options, dict):
                 for option, value in options.items():
                     # Check ob Option sensitiv ist
-                    if sensitive_patterns.search(option):
+                    if _SENSITIVE_OPTION_PATTERN.search(option):
                         # Zeige erste 3 Zeichen für Debugging
                         if value and len(str(value)) > 3:
                             value = f"{str(value)[:3]}***MASKED***"
@@ -935,6 +940,19 @@ class Config:
 
     def _load_config(self) -> None:
         """Load and validate configuration from JSON file with Pydantic."""
+        try:
+            st = os.stat(self.config_file)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+
+        cached = _LOADED_CONFIGS.get(self.config_file)
+        if signature is not None and cached is not None and cached[0] == signature:
+            # Deep copy: set() mutates the sections of this instance
+            self._config = copy.deepcopy(cached[1])
+            logger.debug(f"Configuration reused from cache for {self.config_file}")
+            return
+
         try:
             # Load raw JSON
             with open(self.config_file, "r", encoding="utf-8") as f:
@@ -946,6 +964,11 @@ class Config:
                 # Convert back to dict for backward compatibility
                 self._config = validated_config.model_dump(exclude_unset=False)
                 logger.info(f"Configuration loaded and validated from {self.config_file}")
+                if signature is not None:
+                    _LOADED_CONFIGS[self.config_file] = (
+                        signature,
+                        copy.deepcopy(self._config),
+                    )
             except ValidationError as e:
                 # Format validation errors nicely
                 error_messages = []
@@ -70,6 +70,11 @@ DEFAULT_CONFIG_PATHS = {
     "user": Path.home() / ".config" / "kopi-docka" / "config.json",
 }
 
+# rclone config locations ($RCLONE_CONFIG, read at lookup time, takes precedence
+# over these, same as in rclone itself)
+RCLONE_CONFIG_SUBPATH = ".config/rclone/rclone.conf"
+ROOT_RCLONE_CONFIG = Path("/root") / RCLONE_CONFIG_SUBPATH
+
 # Docker labels
 DOCKER_COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
 DOCKER_COMPOSE_CONFIG_LABEL = "com.docker.compose.project.config_files"
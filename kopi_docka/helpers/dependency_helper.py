@@ -1,11 +1,96 @@
 """Lightweight CLI tool detection utility."""
 
+import functools
+import json
+import os
+import re
 import shutil
 import subprocess
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Optional
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """``shutil.which`` cached for the life of the process.
+
+    Every PATH lookup stats each PATH entry; ``check()`` alone used to walk
+    PATH three times per tool. Call ``DependencyHelper.clear_cache()`` after
+    installing a tool so it is re-discovered.
+    """
+    return shutil.which(name)
+
+
+# Tools whose version output describes the binary itself. ``docker version``
+# reports the *daemon* version, which changes without the client binary
+# changing, so it is never served from the cache.
+_UNCACHED_VERSION_TOOLS = frozenset({"docker"})
+
+# Version extraction from `<tool> --version` output, tried in order
+_VERSION_PATTERNS = (
+    # Full semver with suffix: 1.2.3-alpha1, 2.0.0-rc.1, v1.2.3, version 1.2.3
+    re.compile(r"v?(\d+\.\d+\.\d+(?:-[a-zA-Z0-9._-]+)?)"),
+    # Partial version with suffix: 1.2-beta
+    re.compile(r"v?(\d+\.\d+(?:-[a-zA-Z0-9._-]+)?)"),
+    # Just numbers: 1.2.3, 1.2
+    re.compile(r"(\d+\.\d+(?:\.\d+)?)"),
+)
+
+
+def _version_cache_file() -> Path:
+    """Location of the persistent tool-version cache (XDG cache dir)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "kopi-docka" / "tool-versions.json"
+
+
+def _binary_fingerprint(path: str) -> Optional[str]:
+    """Identify an installed binary by inode metadata; None if not stat-able.
+
+    Upgrading or reinstalling a tool replaces the file, which changes the
+    mtime/size and thereby invalidates its cached version.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_version_cache() -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(_version_cache_file().read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_cached_version(name: str, fingerprint: str, version: str) -> None:
+    """Best-effort write; a read-only or missing cache dir is not an error."""
+    cache_file = _version_cache_file()
+    data = _load_version_cache()
+    data[name] = {"binary": fingerprint, "version": version}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer: a timer run and an interactive
+        # `doctor` must not write into (and then move) the same temp file.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_file.parent, prefix=".tool-versions-", suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 @dataclass
 class ToolInfo:
     """Information about a CLI tool."""
@@ -37,12 +122,17 @@ class DependencyHelper:
     @staticmethod
     def exists(name: str) -> bool:
         """Check if a tool exists in PATH."""
-        return shutil.which(name) is not None
+        return _which(name) is not None
 
     @staticmethod
     def get_path(name: str) -> Optional[str]:
         """Get the full path to a tool."""
-        return shutil.which(name)
+        return _which(name)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached PATH lookups (e.g. after a tool was installed)."""
+        _which.cache_clear()
 
     @staticmethod
     def get_version(name: str, version_cmd: Optional[List[str]] = None) -> Optional[str]:
@@ -70,6 +160,25 @@ class DependencyHelper:
         if not cmd:
             return None
 
+        # Versions of the stock commands are persisted across CLI runs, keyed
+        # by the binary's stat fingerprint, so `doctor` & co. don't fork every
+        # tool on every invocation.
+        fingerprint = None
+        if version_cmd is None and name not in _UNCACHED_VERSION_TOOLS:
+            fingerprint = _binary_fingerprint(_which(name))
+            if fingerprint:
+                cached = _load_version_cache().get(name) or {}
+                if cached.get("binary") == fingerprint and cached.get("version"):
+                    return cached["version"]
+
+        version = DependencyHelper._probe_version(cmd)
+        if fingerprint and version and version != "timeout":
+            _store_cached_version(name, fingerprint, version)
+        return version
+
+    @staticmethod
+    def _probe_version(cmd: List[str]) -> Optional[str]:
+        """Run a version command and parse its output (see get_version)."""
         try:
             result = subprocess.run(
                 cmd,
@@ -86,21 +195,8 @@ class DependencyHelper:
                 return None
 
             # Extract version with robust regex patterns
-            import re
-
-            # Pattern 1: Semantic versioning with optional prefix/suffix
-            # Matches: v1.2.3, 1.2.3-alpha, 1.2.3-rc1, version 1.2.3
-            patterns = [
-                # Full semver with suffix: 1.2.3-alpha1, 2.0.0-rc.1
-                r'v?(\d+\.\d+\.\d+(?:-[a-zA-Z0-9._-]+)?)',
-                # Partial version with suffix: 1.2-beta
-                r'v?(\d+\.\d+(?:-[a-zA-Z0-9._-]+)?)',
-                # Just numbers: 1.2.3, 1.2
-                r'(\d+\.\d+(?:\.\d+)?)',
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, output)
+            for pattern in _VERSION_PATTERNS:
+                match = pattern.search(output)
                 if match:
                     version = match.group(1)
                     # Clean up: remove leading 'v' if present
@@ -108,7 +204,7 @@ class DependencyHelper:
 
             # Fallback: return first 50 chars if no version pattern found
             # This handles tools with non-standard version output
-            return output.split('\n')[0][:50].strip()
+            return output.partition('\n')[0][:50].strip()
 
         except subprocess.TimeoutExpired:
             # Tool exists but version command hangs - return special marker
@@ -28,6 +28,7 @@ Used by:
 import contextlib
 import os
 import re
+import stat
 import subprocess
 import tempfile
 from pathlib import Path
@@ -37,6 +38,10 @@ from . import get_logger
 
 logger = get_logger(__name__)
 
+# Entries that mark a directory as a Kopia filesystem repository
+# (p/ is Kopia's blob storage directory)
+_KOPIA_REPO_MARKERS = frozenset({"kopia.repository", "kopia.repository.f", "p"})
+
 
 def detect_existing_filesystem_repo(kopia_params: str) -> tuple[bool, Optional[Path]]:
     """
@@ -72,19 +77,27 @@ def detect_existing_filesystem_repo(kopia_params: str) -> tuple[bool, Optional[P
         logger.warning(f"Could not resolve path {path_match.group(1)}: {e}")
         return (False, None)
 
-    # Path doesn't exist → no existing repo
-    if not repo_path.exists():
+    # One stat answers both "exists" and "is it a directory"
+    try:
+        st = repo_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         # Check if parent exists - if not, normal create flow will handle it
         return (False, None)
 
     # Check if it's a file (not directory) - this is an error state
-    if repo_path.is_file():
+    if not stat.S_ISDIR(st.st_mode):
         logger.warning(f"Path {repo_path} exists but is a file, not a directory")
         return (False, None)
 
-    # Try to list directory contents - catch permission errors
+    # Single directory pass: emptiness and Kopia repo markers come from the
+    # entry names, stopping at the first marker - no per-marker stat calls
+    has_content = False
     try:
-        dir_contents = list(repo_path.iterdir())
+        with os.scandir(repo_path) as entries:
+            for entry in entries:
+                has_content = True
+                if entry.name in _KOPIA_REPO_MARKERS:
+                    return (True, repo_path)
     except PermissionError as e:
         logger.warning(f"Permission denied reading {repo_path}: {e}")
         # Treat as existing - user needs to fix permissions
@@ -94,19 +107,9 @@ def detect_existing_filesystem_repo(kopia_params: str) -> tuple[bool, Optional[P
         return (False, None)
 
     # Path exists but is empty → no repo yet, normal create flow
-    if not dir_contents:
+    if not has_content:
         return (False, repo_path)
 
-    # Check for Kopia repo markers (kopia.repository or p/ blob directory)
-    kopia_markers = [
-        repo_path / "kopia.repository",
-        repo_path / "kopia.repository.f",
-        repo_path / "p",  # Kopia blob storage directory
-    ]
-
-    if any(marker.exists() for marker in kopia_markers):
-        return (True, repo_path)
-
     # Directory exists with content but no Kopia markers → not a Kopia repo
     # Treat as potential conflict - show wizard so user can decide
     logger.warning(f"Directory {repo_path} exists with content but no Kopia repo markers")
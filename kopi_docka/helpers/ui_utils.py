@@ -266,9 +266,9 @@ def print_menu(title: str, options: List[Tuple[str, str]], border_style: str = "
         options: List of (key, description) tuples
         border_style: Panel border color
     """
-    content = f"[bold cyan]{title}[/bold cyan]\n\n"
-    for key, description in options:
-        content += f"[{key}] {description}\n"
+    lines = [f"[bold cyan]{title}[/bold cyan]", ""]
+    lines += [f"[{key}] {description}" for key, description in options]
+    content = "\n".join(lines)
 
     console.print()
     console.print(Panel.fit(content.strip(), border_style=border_style))
@@ -406,9 +406,9 @@ def print_next_steps(steps: List[str]) -> None:
     Args:
         steps: List of step descriptions
     """
-    content = "[bold]Next Steps:[/bold]\n\n"
-    for i, step in enumerate(steps, 1):
-        content += f"[{i}] {step}\n"
+    lines = ["[bold]Next Steps:[/bold]", ""]
+    lines += [f"[{i}] {step}" for i, step in enumerate(steps, 1)]
+    content = "\n".join(lines)
 
     console.print()
     console.print(
@@ -9,7 +9,7 @@ from __future__ import annotations
 import gettext
 import os
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 # Locale directory (relative to this file)
 LOCALE_DIR = Path(__file__).parent / "locales"
@@ -19,6 +19,17 @@ SUPPORTED_LANGUAGES = {"en", "de"}
 # Global translation function
 _translate: Optional[Callable[[str], str]] = None
 
+# Resolved translation function per language (catalog lookup hits the disk)
+_TRANSLATION_CACHE: Dict[str, Callable[[str], str]] = {}
+
+# Active language for t(); detected from the environment on first use
+_current_lang: Optional[str] = None
+
+
+def _identity(msg: str) -> str:
+    """Fallback translator: return the original string."""
+    return msg
+
 
 def setup_i18n(lang: Optional[str] = None) -> Callable[[str], str]:
     """
@@ -50,17 +61,26 @@ def setup_i18n(lang: Optional[str] = None) -> Callable[[str], str]:
     if lang not in SUPPORTED_LANGUAGES:
         lang = DEFAULT_LANG
 
-    try:
-        # Load translation catalog
-        translation = gettext.translation(
-            "kopi_docka", localedir=LOCALE_DIR, languages=[lang, DEFAULT_LANG], fallback=True
-        )
-        _translate = translation.gettext
-    except (FileNotFoundError, OSError):
-        # Fallback: no translation (return original string)
-        def _translate(x: str) -> str:
-            return x
-
+    cached = _TRANSLATION_CACHE.get(lang)
+    if cached is not None:
+        _translate = cached
+        return _translate
+
+    if not LOCALE_DIR.is_dir():
+        # No catalogs shipped (the usual case): skip gettext's per-locale file probing
+        _translate = _identity
+    else:
+        try:
+            # Load translation catalog
+            translation = gettext.translation(
+                "kopi_docka", localedir=LOCALE_DIR, languages=[lang, DEFAULT_LANG], fallback=True
+            )
+            _translate = translation.gettext
+        except (FileNotFoundError, OSError):
+            # Fallback: no translation (return original string)
+            _translate = _identity
+
+    _TRANSLATION_CACHE[lang] = _translate
     return _translate
 
 
@@ -85,8 +105,15 @@ def _(msg: str) -> str:
 
 
 def get_current_language() -> str:
-    """Get currently active language code"""
-    # Try to detect from environment
+    """Get currently active language code (set_language() or environment)"""
+    global _current_lang
+    if _current_lang is None:
+        _current_lang = _detect_env_language()
+    return _current_lang
+
+
+def _detect_env_language() -> str:
+    """First supported language from LANGUAGE/LANG/LC_ALL, else the default"""
     for env_var in ["LANGUAGE", "LANG", "LC_ALL"]:
         env_value = os.getenv(env_var, "")
         if env_value:
@@ -105,6 +132,8 @@ def set_language(lang: str) -> None:
     """
     if lang not in SUPPORTED_LANGUAGES:
         raise ValueError(f"Unsupported language: {lang}. Must be one of {SUPPORTED_LANGUAGES}")
+    global _current_lang
+    _current_lang = lang
     setup_i18n(lang)
 
 
@@ -223,6 +252,7 @@ _TRANSLATIONS = {
         "common.continue": "Weiter",
     },
 }
+_EN_TRANSLATIONS = _TRANSLATIONS[DEFAULT_LANG]
 
 
 def t(key: str, lang: Optional[str] = None) -> str:
@@ -243,17 +273,6 @@ def t(key: str, lang: Optional[str] = None) -> str:
     if lang is None:
         lang = get_current_language()
 
-    # Try fallback dictionary first
-    if lang in _TRANSLATIONS and key in _TRANSLATIONS[lang]:
-        return _TRANSLATIONS[lang][key]
-
-    # Fallback to English
-    if "en" in _TRANSLATIONS and key in _TRANSLATIONS["en"]:
-        return _TRANSLATIONS["en"][key]
-
-    # Last resort: return key itself
-    return key
-
-
-# Initialize on import
-setup_i18n()
+    # Requested language, then English, then the key itself
+    text = _TRANSLATIONS.get(lang, _EN_TRANSLATIONS).get(key)
+    return text if text is not None else _EN_TRANSLATIONS.get(key, key)
@@ -12,6 +12,22 @@ from unittest.mock import Mock, MagicMock, patch
 from typer.testing import CliRunner
 
 
+@pytest.fixture(autouse=True)
+def _clear_which_cache():
+    """Reset the cached PATH lookups so tests patching shutil.which stay isolated."""
+    from kopi_docka.helpers.dependency_helper import DependencyHelper
+
+    DependencyHelper.clear_cache()
+    yield
+    DependencyHelper.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tool_version_cache(tmp_path, monkeypatch):
+    """Keep the persistent tool-version cache out of the real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+
+
 @pytest.fixture
 def cli_runner():
     """Typer CLI runner for testing commands."""
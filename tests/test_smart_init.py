@@ -138,6 +138,27 @@ class TestDetectExistingFilesystemRepo:
         result = _detect_existing_filesystem_repo(f"filesystem --path {file_path}")
         assert result == (False, None)
 
+    def test_unreadable_directory_returns_true(self, tmp_path):
+        """Permission denied while listing should be treated as an existing repo."""
+        repo_dir = tmp_path / "locked-repo"
+        repo_dir.mkdir()
+
+        with patch("os.scandir", side_effect=PermissionError("denied")):
+            result = _detect_existing_filesystem_repo(f"filesystem --path {repo_dir}")
+        assert result == (True, repo_dir)
+
+    def test_marker_among_many_entries(self, tmp_path):
+        """Markers are found from the directory listing, not separate stats."""
+        repo_dir = tmp_path / "kopia-repo"
+        repo_dir.mkdir()
+        for name in ("q", "x", "_log", "kopia.blobcfg"):
+            (repo_dir / name).mkdir()
+        (repo_dir / "kopia.repository.f").touch()
+
+        with patch("pathlib.Path.exists", side_effect=AssertionError("unexpected stat")):
+            result = _detect_existing_filesystem_repo(f"filesystem --path {repo_dir}")
+        assert result == (True, repo_dir)
+
 
 class TestSmartInitWizard:
     """Tests for _smart_init_wizard()"""
@@ -0,0 +1,38 @@
+"""
+Unit tests for the lazy backend registry in kopi_docka.backends.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from kopi_docka.backends import BACKEND_TYPES, BackendBase, get_backend_class
+
+
+@pytest.mark.unit
+class TestGetBackendClass:
+    """get_backend_class() resolves registered names to backend classes."""
+
+    @pytest.mark.parametrize("backend_type", BACKEND_TYPES)
+    def test_resolves_every_type(self, backend_type):
+        backend_class = get_backend_class(backend_type)
+
+        assert issubclass(backend_class, BackendBase)
+        assert backend_class({}).name == backend_type
+
+    def test_unknown_type(self):
+        assert get_backend_class("ftp") is None
+
+    def test_imports_only_selected_backend(self):
+        code = (
+            "import sys\n"
+            "from kopi_docka.backends import get_backend_class\n"
+            "get_backend_class('sftp')\n"
+            "print(sorted(m for m in sys.modules if m.startswith('kopi_docka.backends.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert "kopi_docka.backends.sftp" in result.stdout
+        assert "kopi_docka.backends.rclone" not in result.stdout
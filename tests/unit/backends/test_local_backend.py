@@ -0,0 +1,66 @@
+"""
+Unit tests for the local filesystem backend.
+
+Covers the ``--path`` parser and ``get_status()`` for existing repositories,
+not-yet-created repositories and unusable paths.
+"""
+
+import pytest
+
+from kopi_docka.backends.local import LocalBackend, _repo_path_from_params
+
+
+@pytest.mark.unit
+class TestRepoPathFromParams:
+    """_repo_path_from_params() extracts the --path value."""
+
+    def test_parses_path(self):
+        path = _repo_path_from_params("filesystem --path /backup/kopia")
+        assert str(path) == "/backup/kopia"
+
+    def test_missing_path(self):
+        assert _repo_path_from_params("") is None
+        assert _repo_path_from_params("filesystem") is None
+        assert _repo_path_from_params("filesystem --path") is None
+
+
+@pytest.mark.unit
+class TestGetStatus:
+    """get_status() reports existence, writability and disk space."""
+
+    def test_existing_repository(self, tmp_path):
+        backend = LocalBackend({"kopia_params": f"filesystem --path {tmp_path}"})
+
+        status = backend.get_status()
+
+        assert status["details"]["path"] == str(tmp_path)
+        assert status["details"]["exists"] is True
+        assert status["details"]["writable"] is True
+        assert status["available"] is True
+        assert status["details"]["disk_total_gb"] is not None
+
+    def test_repository_not_created_yet_checks_parent(self, tmp_path):
+        repo = tmp_path / "kopia-repository"
+        backend = LocalBackend({"kopia_params": f"filesystem --path {repo}"})
+
+        status = backend.get_status()
+
+        assert status["details"]["exists"] is False
+        assert status["details"]["writable"] is True
+        assert status["available"] is True
+
+    def test_missing_parent(self, tmp_path):
+        repo = tmp_path / "missing" / "kopia-repository"
+        backend = LocalBackend({"kopia_params": f"filesystem --path {repo}"})
+
+        status = backend.get_status()
+
+        assert status["details"]["exists"] is False
+        assert status["available"] is False
+        assert status["details"]["disk_total_gb"] is None
+
+    def test_unconfigured(self):
+        status = LocalBackend({}).get_status()
+
+        assert status["configured"] is False
+        assert status["details"]["path"] is None
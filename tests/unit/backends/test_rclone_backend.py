@@ -89,6 +89,34 @@ class TestDetectRcloneConfigWithStatus:
             assert root_config_path in result.checked_paths
             assert len(result.checked_paths) == 2
 
+    def test_detect_config_env_override_wins(
+        self, rclone_backend, mock_env_sudo_user, monkeypatch
+    ):
+        """$RCLONE_CONFIG is checked before the default paths."""
+        override = Path("/srv/rclone/rclone.conf")
+        monkeypatch.setenv("RCLONE_CONFIG", str(override))
+
+        with mock.patch("pathlib.Path.exists", return_value=True):
+            result = rclone_backend._detect_rclone_config_with_status()
+
+        assert result.status == ConfigStatus.FOUND
+        assert result.path == str(override)
+        assert result.checked_paths == [str(override)]
+
+    def test_detect_config_env_override_missing_falls_back(
+        self, rclone_backend, mock_env_no_sudo_user, monkeypatch
+    ):
+        """A stale $RCLONE_CONFIG does not hide root's config."""
+        override = Path("/srv/rclone/rclone.conf")
+        monkeypatch.setenv("RCLONE_CONFIG", str(override))
+        root_config_path = "/root/.config/rclone/rclone.conf"
+
+        with mock.patch("pathlib.Path.exists", lambda self: str(self) == root_config_path):
+            result = rclone_backend._detect_rclone_config_with_status()
+
+        assert result.path == root_config_path
+        assert result.checked_paths == [str(override), root_config_path]
+
     def test_detect_config_no_sudo_user(self, rclone_backend, mock_env_no_sudo_user):
         """Test detection when SUDO_USER env not set, root config exists."""
         root_config_path = "/root/.config/rclone/rclone.conf"
@@ -195,6 +223,30 @@ class TestConfigureMethod:
             # Verify confirm was called (offer to create flow was triggered)
             mock_confirm.assert_called_once()
 
+    def test_configure_warns_about_unknown_remote(self, rclone_backend, capsys):
+        """Test that a typo in the remote name is flagged using the cached listing."""
+        config_path = "/root/.config/rclone/rclone.conf"
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/rclone"),
+            mock.patch.object(rclone_backend, "_detect_rclone_config_with_status") as mock_detect,
+            mock.patch.object(rclone_backend, "_list_remotes", return_value={"gdrive": "drive"}),
+            mock.patch("typer.prompt", side_effect=["gdrvie", "backups"]),
+            mock.patch.object(
+                rclone_backend, "_check_remote_path_exists", side_effect=RuntimeError("stop")
+            ),
+        ):
+            mock_detect.return_value = ConfigDetectionResult(
+                path=config_path, status=ConfigStatus.FOUND, checked_paths=[config_path]
+            )
+
+            with pytest.raises(RuntimeError):
+                rclone_backend.configure()
+
+        out = capsys.readouterr().out
+        assert "gdrive: (drive)" in out
+        assert "Remote 'gdrvie' is not in your rclone config" in out
+
 
 class TestDependencyChecking:
     """Tests for dependency checking with REQUIRED_TOOLS."""
@@ -261,3 +313,110 @@ class TestDependencyChecking:
         assert result["rclone"].installed is False
         assert result["rclone"].path is None
         mock_check_all.assert_called_once_with(["rclone"])
+
+
+class TestListRemotes:
+    """Tests for _list_remotes (single listremotes --long, cached per instance)."""
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_parses_names_and_types(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(
+            returncode=0,
+            stdout="gdrive:     drive\nmy-box:     box\nodd:\n\n",
+        )
+
+        remotes = rclone_backend._list_remotes()
+
+        assert remotes == {"gdrive": "drive", "my-box": "box", "odd": "unknown"}
+        assert mock_run.call_args.args[0] == ["rclone", "listremotes", "--long"]
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_passes_config_path_and_caches(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=0, stdout="gdrive: drive\n")
+
+        rclone_backend._list_remotes("/root/.config/rclone/rclone.conf")
+        rclone_backend._list_remotes("/root/.config/rclone/rclone.conf")
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0][-2:] == ["--config", "/root/.config/rclone/rclone.conf"]
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_failure_returns_empty_and_is_not_cached(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=1, stdout="")
+
+        assert rclone_backend._list_remotes() == {}
+        assert rclone_backend._list_remotes() == {}
+        assert mock_run.call_count == 2
+
+
+class TestRcloneConnectionTest:
+    """Tests for _test_rclone_connection."""
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_single_attempt(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=1, stderr="didn't find section in config")
+
+        ok, stderr = rclone_backend._test_rclone_connection("gdrive", "backups", "/r.conf")
+
+        assert ok is False
+        assert "didn't find section" in stderr
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:3] == ["rclone", "lsd", "gdrive:backups"]
+        assert cmd[cmd.index("--retries") + 1] == "1"
+        assert cmd[cmd.index("--low-level-retries") + 1] == "1"
+        assert cmd[-2:] == ["--config", "/r.conf"]
+
+
+class TestRcloneMkdir:
+    """Tests for _rclone_mkdir."""
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_without_config_path(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=0, stderr="")
+
+        assert rclone_backend._rclone_mkdir("gdrive", "backups") == (True, "")
+        assert mock_run.call_args.args[0] == ["rclone", "mkdir", "gdrive:backups"]
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_with_config_path(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=1, stderr="permission denied")
+
+        ok, err = rclone_backend._rclone_mkdir("gdrive", "backups", "/r.conf")
+
+        assert (ok, err) == (False, "permission denied")
+        assert mock_run.call_args.args[0] == [
+            "rclone", "mkdir", "gdrive:backups", "--config", "/r.conf"
+        ]
+
+
+class TestCheckRemotePathExists:
+    """Tests for _check_remote_path_exists (parses 'rclone lsd' of the parent)."""
+
+    LSD_OUTPUT = (
+        "          -1 2025-01-01 10:00:00        -1 kopia-backup_HOST\n"
+        "          -1 2025-01-01 10:00:00        -1 My Backups\n"
+        "          -1 2025-01-01 10:00:00        -1 kopia-backup_HOST-old\n"
+    )
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_exact_name_match(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=0, stdout=self.LSD_OUTPUT)
+
+        assert rclone_backend._check_remote_path_exists("gdrive", "kopia-backup_HOST") == (True, "")
+        assert mock_run.call_args.args[0][:3] == ["rclone", "lsd", "gdrive:"]
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_folder_name_with_spaces(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=0, stdout=self.LSD_OUTPUT)
+
+        assert rclone_backend._check_remote_path_exists("gdrive", "My Backups")[0] is True
+
+    @patch("kopi_docka.backends.rclone.run_command")
+    def test_prefix_is_not_a_match(self, mock_run, rclone_backend):
+        mock_run.return_value = mock.Mock(returncode=0, stdout=self.LSD_OUTPUT)
+
+        exists, error = rclone_backend._check_remote_path_exists("gdrive", "data/kopia-backup")
+
+        assert exists is False
+        assert "not found" in error
+        assert mock_run.call_args.args[0][:3] == ["rclone", "lsd", "gdrive:data"]
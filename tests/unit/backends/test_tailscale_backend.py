@@ -4,6 +4,7 @@ Unit tests for Tailscale backend dependency checking.
 Tests REQUIRED_TOOLS enforcement for Tailscale SSH-based backup backend.
 """
 
+import subprocess
 from pathlib import Path
 from unittest.mock import patch, Mock
 import pytest
@@ -243,7 +244,8 @@ def _run_setup_interactive(backend, *, known_hosts_return, ssh_user="root", remo
     peer.online = True
     peer.os = "linux"
 
-    with patch.object(TailscaleBackend, '_is_running', return_value=True), \
+    with patch.object(TailscaleBackend, '_get_status', return_value={}), \
+         patch.object(TailscaleBackend, '_is_running', return_value=True), \
          patch.object(TailscaleBackend, '_list_peers', return_value=[peer]), \
          patch.object(TailscaleBackend, '_setup_ssh_key', return_value=True), \
          patch.object(TailscaleBackend, '_ensure_key_on_remote', return_value=None), \
@@ -471,3 +473,85 @@ class TestMirrorPersistentPath:
         remote_cmd = ssh_argv[-1]
         assert "touch /boot/config/ssh/root " in remote_cmd  # space after = file
         assert "/boot/config/ssh/root/authorized_keys" not in remote_cmd
+
+
+class TestRecoveryInstructions:
+    """get_recovery_instructions() renders the module-level template."""
+
+    def test_prefers_fqdn_and_fills_placeholders(self):
+        backend = TailscaleBackend(
+            {
+                "credentials": {
+                    "peer_hostname": "nas",
+                    "peer_fqdn": "nas.tail1234.ts.net",
+                    "ssh_user": "backup",
+                    "remote_path": "/srv/kopia",
+                }
+            }
+        )
+
+        text = backend.get_recovery_instructions()
+
+        assert "tailscale ping nas\n" in text
+        assert "--path sftp://backup@nas.tail1234.ts.net:/srv/kopia \\\n" in text
+        assert "{" not in text
+
+    def test_defaults_for_old_configs(self):
+        text = TailscaleBackend({}).get_recovery_instructions()
+
+        assert "**Peer:** `backup-server`" in text
+        assert "root@backup-server:/backup/kopi-docka" in text
+
+
+class TestTailscaleStatus:
+    """`tailscale status --json` is read once and shared by the status helpers."""
+
+    STATUS = {
+        "BackendState": "Running",
+        "Peer": {
+            "nodekey:1": {
+                "HostName": "nas",
+                "DNSName": "nas.tail1234.ts.net.",
+                "TailscaleIPs": ["100.64.0.2"],
+                "Online": False,
+                "OS": "linux",
+            }
+        },
+    }
+
+    def test_is_running_reads_backend_state(self, tailscale_backend):
+        assert tailscale_backend._is_running(self.STATUS) is True
+        assert tailscale_backend._is_running({"BackendState": "Stopped"}) is False
+        assert tailscale_backend._is_running({}) is False
+
+    def test_list_peers_reuses_given_status(self, tailscale_backend):
+        with patch("kopi_docka.backends.tailscale.run_command") as run:
+            peers = tailscale_backend._list_peers(self.STATUS)
+
+        run.assert_not_called()
+        assert [(p.hostname, p.dns_name, p.ip) for p in peers] == [
+            ("nas", "nas.tail1234.ts.net", "100.64.0.2")
+        ]
+
+    def test_get_status_empty_when_tailscale_missing(self, tailscale_backend):
+        with patch(
+            "kopi_docka.backends.tailscale.run_command", side_effect=FileNotFoundError
+        ):
+            assert tailscale_backend._get_status() == {}
+
+    def test_start_streams_tailscale_up_output(self, tailscale_backend):
+        with patch("kopi_docka.backends.tailscale.run_command") as run, \
+             patch("kopi_docka.helpers.ui_utils.print_success"):
+            assert tailscale_backend._start_tailscale() is True
+
+        assert run.call_args.args[0] == ["sudo", "tailscale", "up"]
+        assert run.call_args.kwargs["show_output"] is True
+
+    def test_start_timeout_reports_failure(self, tailscale_backend):
+        with patch(
+            "kopi_docka.backends.tailscale.run_command",
+            side_effect=subprocess.TimeoutExpired(["tailscale", "up"], 30),
+        ), patch("kopi_docka.helpers.ui_utils.print_error") as print_error:
+            assert tailscale_backend._start_tailscale() is False
+
+        print_error.assert_called_once()
@@ -80,7 +80,7 @@ class TestBackupCommand:
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
     @patch("kopi_docka.commands.backup_commands.DockerDiscovery")
-    @patch("kopi_docka.commands.backup_commands.BackupManager")
+    @patch("kopi_docka.cores.backup_manager.BackupManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_backup_all_units(
         self,
@@ -124,7 +124,7 @@ class TestBackupCommand:
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
     @patch("kopi_docka.commands.backup_commands.DockerDiscovery")
-    @patch("kopi_docka.commands.backup_commands.BackupManager")
+    @patch("kopi_docka.cores.backup_manager.BackupManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_backup_specific_unit(
         self,
@@ -203,7 +203,7 @@ class TestBackupCommand:
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
     @patch("kopi_docka.commands.backup_commands.DockerDiscovery")
-    @patch("kopi_docka.commands.backup_commands.BackupManager")
+    @patch("kopi_docka.cores.backup_manager.BackupManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_backup_handles_errors(
         self,
@@ -252,7 +252,7 @@ class TestRestoreCommand:
         assert "Root-Rechte" in output or "benötigt Root" in output
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
-    @patch("kopi_docka.commands.backup_commands.RestoreManager")
+    @patch("kopi_docka.cores.restore_manager.RestoreManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_restore_interactive(
         self, mock_repo_class, mock_restore_class, mock_dep_manager_class, cli_runner, mock_root, tmp_config
@@ -270,7 +270,7 @@ class TestRestoreCommand:
         mock_restore.interactive_restore.assert_called_once()
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
-    @patch("kopi_docka.commands.backup_commands.RestoreManager")
+    @patch("kopi_docka.cores.restore_manager.RestoreManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_restore_handles_errors(
         self, mock_repo_class, mock_restore_class, mock_dep_manager_class, cli_runner, mock_root, tmp_config
@@ -54,7 +54,7 @@ class TestBackupCommand:
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
     @patch("kopi_docka.commands.backup_commands.DockerDiscovery")
-    @patch("kopi_docka.commands.backup_commands.BackupManager")
+    @patch("kopi_docka.cores.backup_manager.BackupManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_backup_all_units(
         self,
@@ -113,7 +113,7 @@ class TestRestoreCommand:
         assert "Root-Rechte" in output or "benötigt Root" in output
 
     @patch("kopi_docka.cores.dependency_manager.DependencyManager")
-    @patch("kopi_docka.commands.backup_commands.RestoreManager")
+    @patch("kopi_docka.cores.restore_manager.RestoreManager")
     @patch("kopi_docka.commands.backup_commands.KopiaRepository")
     def test_restore_interactive(
         self, mock_repo_class, mock_restore_class, mock_dep_manager_class, mock_root, mock_ctx
@@ -169,3 +169,16 @@ class TestRepairKopiaParams:
         assert result.exit_code == 0, result.output
         new_params = json.loads(cfg_file.read_text())["kopia"]["kopia_params"]
         assert "--host=legacy-peer" in new_params
+
+
+@pytest.mark.unit
+class TestBackendMenu:
+    """The config wizard's repository menu lists every registered backend once."""
+
+    def test_menu_matches_backend_registry(self):
+        from kopi_docka.backends import BACKEND_TYPES
+        from kopi_docka.commands.config_commands import _BACKEND_MENU
+
+        names = [name for name, _ in _BACKEND_MENU]
+        assert sorted(names) == sorted(BACKEND_TYPES)
+        assert names[0] == "filesystem"  # default choice [1]
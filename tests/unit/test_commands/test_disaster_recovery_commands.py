@@ -50,7 +50,7 @@ def _patches():
             return_value=True,
         ),
         patch(
-            "kopi_docka.commands.disaster_recovery_commands.DisasterRecoveryManager"
+            "kopi_docka.cores.disaster_recovery_manager.DisasterRecoveryManager"
         ),
     ]
 
@@ -97,7 +97,7 @@ class TestStreamHappyPath:
             "kopi_docka.helpers.dependency_helper.DependencyHelper.exists",
             return_value=True,
         ), patch(
-            "kopi_docka.commands.disaster_recovery_commands.DisasterRecoveryManager"
+            "kopi_docka.cores.disaster_recovery_manager.DisasterRecoveryManager"
         ) as mock_mgr_cls:
             mock_mgr = mock_mgr_cls.return_value
             mock_mgr.export_to_stream.return_value = None
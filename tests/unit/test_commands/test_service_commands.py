@@ -0,0 +1,46 @@
+"""Tests for the interactive service management helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kopi_docka.commands import service_commands
+
+
+@pytest.fixture
+def helper():
+    helper = MagicMock()
+    helper.get_current_schedule.return_value = "*-*-* 02:00:00"
+    helper.edit_timer_schedule.return_value = True
+    helper.get_timer_status.return_value.next_run = None
+    return helper
+
+
+@pytest.mark.unit
+class TestConfigureTimer:
+    """_configure_timer() maps menu choices to OnCalendar schedules."""
+
+    @pytest.mark.parametrize(
+        "choice, schedule",
+        [("1", "*-*-* 02:00:00"), ("3", "*-*-* 04:00:00"), ("4", "*-*-* 23:00:00")],
+    )
+    def test_preset_choice(self, helper, choice, schedule):
+        with (
+            patch.object(service_commands, "console") as console,
+            patch.object(service_commands, "confirm_action", return_value=True),
+        ):
+            console.input.side_effect = [choice, ""]
+            service_commands._configure_timer(helper)
+
+        helper.edit_timer_schedule.assert_called_once_with(schedule)
+
+    def test_custom_time(self, helper):
+        helper.validate_time_format.return_value = True
+        with (
+            patch.object(service_commands, "console") as console,
+            patch.object(service_commands, "confirm_action", return_value=True),
+        ):
+            console.input.side_effect = ["5", "14:30", ""]
+            service_commands._configure_timer(helper)
+
+        helper.edit_timer_schedule.assert_called_once_with("*-*-* 14:30:00")
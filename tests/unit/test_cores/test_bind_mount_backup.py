@@ -249,13 +249,14 @@ class TestStoppedContainerDiscovery:
         mock_run.side_effect = [
             CompletedProcess([], 0, stdout="run1\n", stderr=""),  # ps -q (running)
             CompletedProcess([], 0, stdout="run1\nstop1\n", stderr=""),  # ps -aq --filter
-            # inspect run1 (running, compose)
-            CompletedProcess([], 0, stdout=json.dumps([_container_inspect(
-                "run1", "app_web", labels={DOCKER_COMPOSE_PROJECT_LABEL: "app"})]), stderr=""),
-            # inspect stop1 (stopped, compose)
-            CompletedProcess([], 0, stdout=json.dumps([_container_inspect(
-                "stop1", "app_worker", labels={DOCKER_COMPOSE_PROJECT_LABEL: "app"},
-                status="exited")]), stderr=""),
+            # inspect run1 (running, compose) + stop1 (stopped, compose)
+            CompletedProcess([], 0, stdout=json.dumps([
+                _container_inspect(
+                    "run1", "app_web", labels={DOCKER_COMPOSE_PROJECT_LABEL: "app"}),
+                _container_inspect(
+                    "stop1", "app_worker", labels={DOCKER_COMPOSE_PROJECT_LABEL: "app"},
+                    status="exited"),
+            ]), stderr=""),
         ]
 
         containers = discovery._discover_containers()
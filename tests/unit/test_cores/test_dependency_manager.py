@@ -400,6 +400,22 @@ class TestGetMissing:
         assert "kopia" in missing
 
 
+class TestExportRequirements:
+    """Test export_requirements method."""
+
+    @patch('kopi_docka.helpers.dependency_helper.DependencyHelper.exists')
+    def test_export_checks_each_dependency_once(self, mock_exists, dep_manager):
+        """status and missing come from a single probe per tool."""
+        mock_exists.side_effect = lambda name: name != "rsync"
+
+        exported = dep_manager.export_requirements()
+
+        assert exported["missing"] == ["rsync"]
+        assert exported["status"]["docker"] is True
+        probed = [c.args[0] for c in mock_exists.call_args_list]
+        assert probed.count("docker") == 1
+
+
 class TestPrintStatus:
     """Test print_status method."""
 
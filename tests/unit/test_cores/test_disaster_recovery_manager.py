@@ -269,6 +269,17 @@ class TestRcloneConfigDetection:
 
         assert result == Path("/home/testuser/.config/rclone/rclone.conf")
 
+    def test_find_rclone_env_override_read_at_lookup(self, monkeypatch):
+        """$RCLONE_CONFIG set after import is honoured before the default paths."""
+        config = make_mock_config(kopia_params="filesystem --path /test")
+        manager = DisasterRecoveryManager(config)
+        monkeypatch.setenv("RCLONE_CONFIG", "/srv/rclone/rclone.conf")
+
+        with patch("pathlib.Path.exists", return_value=True):
+            result = manager._find_rclone_config()
+
+        assert result == Path("/srv/rclone/rclone.conf")
+
     def test_find_rclone_not_found(self):
         """Returns None when no rclone config found."""
         config = make_mock_config(kopia_params="filesystem --path /test")
@@ -279,6 +290,18 @@ class TestRcloneConfigDetection:
 
         assert result is None
 
+    def test_find_rclone_resolved_once(self):
+        """Repeated lookups reuse the first result instead of re-probing."""
+        config = make_mock_config(kopia_params="filesystem --path /test")
+        manager = DisasterRecoveryManager(config)
+
+        with patch("pathlib.Path.exists", return_value=False) as mock_exists:
+            assert manager._find_rclone_config() is None
+            probes = mock_exists.call_count
+            assert manager._find_rclone_config() is None
+
+        assert mock_exists.call_count == probes
+
 
 # =============================================================================
 # Recovery Info Creation Tests
@@ -556,6 +579,16 @@ class TestRepositoryExtraction:
         assert repo_type == "custom-backend"
         assert connection == {"custom_param": "value"}
 
+    def test_extract_keeps_only_connect_field(self):
+        """Single-field backends drop unrelated keys and default to ''."""
+        manager = DisasterRecoveryManager(make_mock_config())
+
+        _rt, conn = manager._extract_repo_from_status(
+            {"storage": {"type": "s3", "config": {"endpoint": "s3.example.com"}}}
+        )
+
+        assert conn == {"bucket": ""}
+
 
 # =============================================================================
 # Kopia Config Export Tests
@@ -218,11 +218,11 @@ class TestDiscoverContainers:
         discovery = make_discovery()
 
         # Mock docker ps -q, then docker ps -aq --filter label=compose (no
-        # stopped compose containers → empty), then the inspects.
+        # stopped compose containers → empty), then one batched inspect.
         mock_run.side_effect = [
             CompletedProcess([], 0, stdout="abc123\nxyz789\n", stderr=""),
             CompletedProcess([], 0, stdout="", stderr=""),
-            # docker inspect abc123
+            # docker inspect abc123 xyz789
             CompletedProcess(
                 [],
                 0,
@@ -234,24 +234,14 @@ class TestDiscoverContainers:
                             "Config": {"Image": "nginx:latest", "Labels": {}, "Env": []},
                             "State": {"Status": "running"},
                             "Mounts": [],
-                        }
-                    ]
-                ),
-                stderr="",
-            ),
-            # docker inspect xyz789
-            CompletedProcess(
-                [],
-                0,
-                stdout=json.dumps(
-                    [
+                        },
                         {
                             "Id": "xyz789",
                             "Name": "/db",
                             "Config": {"Image": "postgres:15", "Labels": {}, "Env": []},
                             "State": {"Status": "running"},
                             "Mounts": [{"Type": "volume", "Name": "pgdata"}],
-                        }
+                        },
                     ]
                 ),
                 stderr="",
@@ -266,6 +256,9 @@ class TestDiscoverContainers:
         assert containers[1].name == "db"
         assert containers[1].database_type == "postgres"
         assert containers[1].volumes == ["pgdata"]
+        # Both ids inspected in a single docker call
+        assert mock_run.call_count == 3
+        assert mock_run.call_args_list[2][0][0] == ["docker", "inspect", "abc123", "xyz789"]
 
     @patch("kopi_docka.cores.docker_discovery.run_command")
     def test_discover_containers_empty_result(self, mock_run):
@@ -285,7 +278,9 @@ class TestDiscoverContainers:
         mock_run.side_effect = [
             CompletedProcess([], 0, stdout="abc123\nxyz789\n", stderr=""),
             CompletedProcess([], 0, stdout="", stderr=""),  # ps -aq --filter (none)
-            # First inspect fails
+            # Batched inspect fails (one id vanished)
+            Exception("No such object: abc123"),
+            # Per-id fallback: first inspect fails
             Exception("Container not found"),
             # Second inspect succeeds
             CompletedProcess(
@@ -644,17 +639,7 @@ class TestDiscoverBackupUnits:
                             },
                             "State": {"Status": "running"},
                             "Mounts": [{"Type": "volume", "Name": "webdata"}],
-                        }
-                    ]
-                ),
-                stderr="",
-            ),
-            # docker inspect c2
-            CompletedProcess(
-                [],
-                0,
-                stdout=json.dumps(
-                    [
+                        },
                         {
                             "Id": "c2",
                             "Name": "/myapp_db_1",
@@ -665,7 +650,7 @@ class TestDiscoverBackupUnits:
                             },
                             "State": {"Status": "running"},
                             "Mounts": [{"Type": "volume", "Name": "pgdata"}],
-                        }
+                        },
                     ]
                 ),
                 stderr="",
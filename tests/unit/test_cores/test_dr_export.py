@@ -77,6 +77,7 @@ def _make_manager(config=None, repo_status=None):
 
     manager = DisasterRecoveryManager.__new__(DisasterRecoveryManager)
     manager.config = config
+    manager._rclone_config_cache = None
     manager.repo = Mock()
     manager.repo._get_env.return_value = {"KOPIA_PASSWORD": "test-password"}
     manager.repo.status.return_value = repo_status
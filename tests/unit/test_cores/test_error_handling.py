@@ -337,11 +337,12 @@ class TestDockerDiscoveryErrors:
         """Should skip containers that fail to inspect."""
         from kopi_docka.cores.docker_discovery import DockerDiscovery
 
-        # ps -q returns IDs, ps -aq --filter returns none, then inspects
-        # (c1 fails, c2 succeeds).
+        # ps -q returns IDs, ps -aq --filter returns none, the batched inspect
+        # fails, then the per-id fallback (c1 fails, c2 succeeds).
         mock_run.side_effect = [
             CompletedProcess([], 0, stdout="c1\nc2\n", stderr=""),
             CompletedProcess([], 0, stdout="", stderr=""),  # ps -aq --filter (none)
+            Exception("No such object: c1"),  # batched inspect fails
             Exception("Container not found"),  # c1 inspect fails
             CompletedProcess(
                 [],
@@ -12,7 +12,7 @@ from pathlib import Path
 from subprocess import CompletedProcess
 from unittest.mock import patch, Mock, MagicMock
 
-from kopi_docka.cores.repository_manager import KopiaRepository
+from kopi_docka.cores.repository_manager import KopiaRepository, filesystem_repo_cmd
 from kopi_docka.types import MachineInfo
 
 
@@ -43,6 +43,14 @@ def make_repository(config: Mock = None) -> KopiaRepository:
     return repo
 
 
+def with_kopia_config(repo: KopiaRepository, tmp_path: Path) -> KopiaRepository:
+    """Give the repo an existing Kopia connect-config; is_connected() only probes then."""
+    cfg_file = tmp_path / f"repository-{repo.profile_name}.config"
+    cfg_file.write_text("{}")
+    repo._config_file_cache = (repo.profile_name, str(cfg_file))
+    return repo
+
+
 # =============================================================================
 # Config File Path Tests
 # =============================================================================
@@ -70,6 +78,18 @@ class TestGetConfigFile:
 
         assert "repository-kopi-docka.config" in config_file
 
+    def test_directory_created_once_per_profile(self):
+        """Repeated lookups reuse the path; a profile switch rebuilds it."""
+        repo = make_repository()
+
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            first = repo._get_config_file()
+            assert repo._get_config_file() == first
+            repo.profile_name = "other"
+            assert "repository-other.config" in repo._get_config_file()
+
+        assert mock_mkdir.call_count == 2
+
 
 # =============================================================================
 # Environment Tests
@@ -121,11 +141,11 @@ class TestIsConnected:
 
     @patch("shutil.which")
     @patch("kopi_docka.cores.repository_manager.run_command")
-    def test_returns_true_when_connected(self, mock_run_command, mock_which):
+    def test_returns_true_when_connected(self, mock_run_command, mock_which, tmp_path):
         """Should return True when kopia status succeeds."""
         mock_which.return_value = "/usr/bin/kopia"
         mock_run_command.return_value = CompletedProcess([], 0, stdout="{}", stderr="")
-        repo = make_repository()
+        repo = with_kopia_config(make_repository(), tmp_path)
 
         result = repo.is_connected()
 
@@ -143,6 +163,17 @@ class TestIsConnected:
 
         assert result is False
 
+    @patch("shutil.which")
+    @patch("kopi_docka.cores.repository_manager.run_command")
+    def test_no_probe_without_kopia_config(self, mock_run_command, mock_which, tmp_path):
+        """Without a connect-config for the profile, no 'repository status' is forked."""
+        mock_which.return_value = "/usr/bin/kopia"
+        repo = make_repository()
+        repo._config_file_cache = (repo.profile_name, str(tmp_path / "missing.config"))
+
+        assert repo.is_connected() is False
+        mock_run_command.assert_not_called()
+
     @patch("shutil.which")
     def test_returns_false_when_kopia_not_installed(self, mock_which):
         """Should return False when kopia binary not found."""
@@ -349,6 +380,51 @@ class TestStatus:
         with pytest.raises(RuntimeError, match="repository status.*failed"):
             repo.status()
 
+    @patch("shutil.which", return_value="/usr/bin/kopia")
+    @patch("kopi_docka.cores.repository_manager.run_command")
+    def test_reuses_is_connected_probe(self, mock_run_command, mock_which, tmp_path):
+        """status() right after is_connected() should not fork kopia again."""
+        status_json = {"storage": {"type": "rclone"}}
+        mock_run_command.return_value = CompletedProcess(
+            [], 0, stdout=json.dumps(status_json), stderr=""
+        )
+        repo = with_kopia_config(make_repository(), tmp_path)
+
+        assert repo.is_connected() is True
+        assert repo.status(json_output=True) == status_json
+        assert repo.status(json_output=True) == status_json
+
+        assert mock_run_command.call_count == 1
+
+    @patch("kopi_docka.cores.repository_manager.run_command")
+    def test_status_cache_expires_and_is_dropped_on_disconnect(self, mock_run_command):
+        """Stale or disconnected status results are not served from cache."""
+        mock_run_command.return_value = CompletedProcess([], 0, stdout="{}", stderr="")
+        repo = make_repository()
+
+        repo.status()
+        repo._status_cache = (repo._status_cache[0], repo._status_cache[1] - 3600)
+        repo.status()
+        repo.disconnect()
+        repo.status()
+
+        # status, expired status, disconnect, status after disconnect
+        assert mock_run_command.call_count == 4
+
+    @patch("kopi_docka.cores.repository_manager.shutil.which", return_value="/usr/bin/kopia")
+    @patch("kopi_docka.cores.repository_manager.run_command")
+    def test_disconnect_records_disconnected_state(self, mock_run_command, _which, tmp_path):
+        """After disconnect() is_connected() answers False without a probe."""
+        mock_run_command.return_value = CompletedProcess([], 0, stdout="{}", stderr="")
+        repo = with_kopia_config(make_repository(), tmp_path)
+
+        assert repo.is_connected() is True
+        repo.disconnect()
+
+        assert repo.is_connected() is False
+        # status probe + disconnect; no second probe
+        assert mock_run_command.call_count == 2
+
 
 # =============================================================================
 # Create Snapshot Tests
@@ -922,6 +998,20 @@ class TestListBackupUnits:
         app1 = next(u for u in units if u["name"] == "app1")
         assert app1["snapshot_id"] == "snap2"
 
+    @patch("kopi_docka.cores.repository_manager.run_command")
+    def test_reuses_given_snapshots(self, mock_run_command):
+        """Passing an existing snapshot list skips the second 'snapshot list'."""
+        repo = make_repository()
+        snapshots = [
+            {"id": "snap1", "timestamp": "", "tags": {"type": "recipe", "unit": "a"}},
+            {"id": "snap2", "timestamp": "", "tags": {"type": "volume", "unit": "a"}},
+        ]
+
+        units = repo.list_backup_units(snapshots)
+
+        assert [u["name"] for u in units] == ["a"]
+        mock_run_command.assert_not_called()
+
 
 # =============================================================================
 # Plan 0026 Phase B: rclone startup-timeout configurability + self-healing
@@ -958,6 +1048,37 @@ class TestGetRcloneArgs:
         assert repo._get_rclone_args() == ["--rclone-startup-timeout=120s"]
 
 
+@pytest.mark.unit
+class TestRepositoryCmd:
+    """Tests for the shared create/connect command builders."""
+
+    def test_create_command(self):
+        repo = make_repository(make_mock_config(kopia_params="rclone --remote-path=g:"))
+        assert repo._repository_cmd("create", ["rclone", "--remote-path=g:"]) == [
+            "kopia", "repository", "create", "rclone", "--remote-path=g:",
+            "--description", "Kopi-Docka Backup Repository (kopi-docka)",
+            "--rclone-startup-timeout=120s",
+        ]  # fmt: skip
+
+    def test_connect_command(self):
+        repo = make_repository()
+        assert repo._repository_cmd("connect", ["filesystem", "--path", "/backup/repo"]) == [
+            "kopia", "repository", "connect", "filesystem", "--path", "/backup/repo",
+            "--content-cache-size-mb", "500", "--metadata-cache-size-mb", "100",
+        ]  # fmt: skip
+
+    def test_filesystem_create_command(self):
+        assert filesystem_repo_cmd("create", Path("/srv/repo"), "p1") == [
+            "kopia", "repository", "create", "filesystem", "--path", "/srv/repo",
+            "--description", "Kopi-Docka Backup Repository (p1)",
+        ]  # fmt: skip
+
+    def test_filesystem_connect_command(self):
+        assert filesystem_repo_cmd("connect", Path("/srv/repo"), "p1") == [
+            "kopia", "repository", "connect", "filesystem", "--path", "/srv/repo",
+        ]  # fmt: skip
+
+
 @pytest.mark.unit
 class TestMaybePatchRepoConfigForRclone:
     """Tests for _maybe_patch_repo_config_for_rclone() — the self-healing
@@ -31,6 +31,30 @@ class TestServiceHelper:
         assert helper.timer_file == Path("/etc/systemd/system/kopi-docka.timer")
 
 
+class TestLastBackupInfo:
+    """Test journal parsing in get_last_backup_info."""
+
+    def test_most_recent_result_wins(self, helper):
+        logs = [
+            "Dec 20 02:00:00 host kopi-docka[1]: Backup failed",
+            "Dec 21 02:00:00 host kopi-docka[2]: Starting backup",
+            "Dec 21 02:05:00 host kopi-docka[2]: Backup finished successfully",
+        ]
+        with patch.object(helper, "get_logs", return_value=logs):
+            info = helper.get_last_backup_info()
+
+        assert info.status == "success"
+        assert info.timestamp == "Dec 21 02:05:00"
+
+    def test_running_backup_reports_start_time(self, helper):
+        logs = ["Dec 21 02:00:00 host kopi-docka[2]: Starting backup"]
+        with patch.object(helper, "get_logs", return_value=logs):
+            info = helper.get_last_backup_info()
+
+        assert info.status == "unknown"
+        assert info.timestamp == "Dec 21 02:00:00"
+
+
 class TestValidation:
     """Test validation methods."""
 
@@ -0,0 +1,53 @@
+"""
+Unit tests for the sd_notify helpers in service_manager.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from kopi_docka.cores import service_manager
+
+
+@pytest.mark.unit
+class TestSdNotify:
+    """The notify helpers go through the import-time resolved _sd_notify."""
+
+    def test_noop_without_systemd(self, monkeypatch):
+        monkeypatch.setattr(service_manager, "_sd_notify", None)
+        monkeypatch.setenv("NOTIFY_SOCKET", "/run/systemd/notify")
+
+        # Must not raise even though a socket is advertised
+        service_manager.sd_notify_ready("idle")
+        service_manager.sd_notify_watchdog()
+
+    def test_noop_without_notify_socket(self, monkeypatch):
+        notify = Mock()
+        monkeypatch.setattr(service_manager, "_sd_notify", notify)
+        monkeypatch.delenv("NOTIFY_SOCKET", raising=False)
+
+        service_manager.sd_notify_status("Running backup")
+
+        notify.assert_not_called()
+
+    def test_messages(self, monkeypatch):
+        notify = Mock()
+        monkeypatch.setattr(service_manager, "_sd_notify", notify)
+        monkeypatch.setenv("NOTIFY_SOCKET", "/run/systemd/notify")
+
+        service_manager.sd_notify_ready("idle")
+        service_manager.sd_notify_status("Running backup")
+        service_manager.sd_notify_stopping()
+        service_manager.sd_notify_watchdog()
+
+        assert [c.args[0] for c in notify.call_args_list] == [
+            "READY=1\nSTATUS=idle",
+            "STATUS=Running backup",
+            "STOPPING=1",
+            "WATCHDOG=1",
+        ]
+
+    def test_notify_errors_are_swallowed(self, monkeypatch):
+        monkeypatch.setattr(service_manager, "_sd_notify", Mock(side_effect=OSError("gone")))
+        monkeypatch.setenv("NOTIFY_SOCKET", "/run/systemd/notify")
+
+        service_manager.sd_notify_watchdog()
@@ -302,6 +302,45 @@ class TestConfigGetList:
         assert cfg.getlist("backup", "nonexistent") == []
 
 
+class TestConfigLoadCache:
+    """Unchanged config files are parsed and validated only once per process."""
+
+    def test_second_instance_reuses_parse(self, tmp_path):
+        config_file = make_config_file(tmp_path, MINIMAL_CONFIG)
+        Config(config_path=config_file)
+
+        with patch("kopi_docka.helpers.config.ConfigModel") as model:
+            cfg = Config(config_path=config_file)
+
+        model.assert_not_called()
+        assert cfg.get("kopia", "profile") == "default"
+
+    def test_instances_do_not_share_state(self, tmp_path):
+        config_file = make_config_file(tmp_path, MINIMAL_CONFIG)
+        first = Config(config_path=config_file)
+        first.set("kopia", "profile", "changed-in-memory")
+
+        second = Config(config_path=config_file)
+
+        assert second.get("kopia", "profile") == "default"
+
+    def test_save_invalidates(self, cfg):
+        cfg.set("kopia", "profile", "saved-profile")
+        cfg.save()
+
+        assert Config(config_path=cfg.config_file).get("kopia", "profile") == "saved-profile"
+
+    def test_external_edit_is_picked_up(self, tmp_path):
+        config_file = make_config_file(tmp_path, MINIMAL_CONFIG)
+        Config(config_path=config_file)
+
+        data = json.loads(json.dumps(MINIMAL_CONFIG))
+        data["kopia"]["profile"] = "edited-by-hand"
+        make_config_file(tmp_path, data)
+
+        assert Config(config_path=config_file).get("kopia", "profile") == "edited-by-hand"
+
+
 class TestConfigSet:
     def test_set_creates_section(self, cfg):
         cfg.set("newsection", "key", "value")
@@ -324,6 +363,11 @@ class TestConfigSave:
         mode = oct(os.stat(cfg.config_file).st_mode)[-3:]
         assert mode == "600"
 
+    def test_save_tightens_world_readable_file(self, cfg):
+        cfg.config_file.chmod(0o644)
+        cfg.save()
+        assert oct(os.stat(cfg.config_file).st_mode)[-3:] == "600"
+
     def test_save_atomic(self, cfg, tmp_path):
         """No leftover temp files after save."""
         cfg.save()
@@ -331,6 +375,15 @@ class TestConfigSave:
         assert tmp_files == []
 
 
+class TestConfigDisplay:
+    def test_masks_sensitive_options(self, cfg, capsys):
+        cfg.display()
+        out = capsys.readouterr().out
+        assert "password = tes***MASKED***" in out
+        assert "testpassword123" not in out
+        assert "profile = " in out
+
+
 class TestUpdateRetention:
     def test_updates_all_fields(self, cfg):
         cfg.update_retention(5, 2, 14, 8, 24, 6)
@@ -367,6 +420,17 @@ class TestPasswordFile:
         assert pw_file
         assert Path(pw_file).exists()
         assert Path(pw_file).read_text().strip() == "filepassword789"
+        assert oct(os.stat(pw_file).st_mode)[-3:] == "600"
+
+    def test_set_password_to_file_tightens_existing_file(self, cfg):
+        pw_file = cfg.config_file.parent / f".{cfg.config_file.stem}.password"
+        pw_file.write_text("old\n")
+        pw_file.chmod(0o644)
+
+        cfg.set_password("new-secret", use_file=True)
+
+        assert pw_file.read_text() == "new-secret\n"
+        assert oct(os.stat(pw_file).st_mode)[-3:] == "600"
 
     def test_get_password_from_file(self, cfg):
         cfg.set_password("fromfile", use_file=True)
@@ -386,6 +450,18 @@ class TestPasswordFile:
         with pytest.raises(ValueError, match="Password file not found"):
             cfg.get_password()
 
+    def test_password_file_empty_raises(self, cfg, tmp_path):
+        pw_file = tmp_path / "empty.password"
+        pw_file.write_text("\n")
+        cfg.set("kopia", "password_file", str(pw_file))
+        with pytest.raises(ValueError, match="Password file is empty"):
+            cfg.get_password()
+
+    def test_password_file_is_directory_raises(self, cfg, tmp_path):
+        cfg.set("kopia", "password_file", str(tmp_path))
+        with pytest.raises(ValueError, match="Cannot read password file"):
+            cfg.get_password()
+
 
 class TestConfigProperties:
     def test_kopia_profile(self, cfg):
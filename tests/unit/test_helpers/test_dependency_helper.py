@@ -1,6 +1,7 @@
 """Unit tests for DependencyHelper utility class."""
 
 import subprocess
+import tempfile
 from unittest.mock import Mock, patch
 import pytest
 from kopi_docka.helpers.dependency_helper import DependencyHelper, ToolInfo
@@ -54,6 +55,32 @@ class TestDependencyHelperGetPath:
         mock_which.assert_called_once_with("nonexistent-tool")
 
 
+class TestDependencyHelperWhichCache:
+    """PATH lookups are cached until clear_cache()."""
+
+    @patch('shutil.which')
+    def test_lookup_is_cached(self, mock_which):
+        """Repeated checks for the same tool walk PATH only once."""
+        mock_which.return_value = "/usr/bin/rclone"
+
+        assert DependencyHelper.exists("rclone") is True
+        assert DependencyHelper.get_path("rclone") == "/usr/bin/rclone"
+
+        mock_which.assert_called_once_with("rclone")
+
+    @patch('shutil.which')
+    def test_clear_cache_rediscovers_tool(self, mock_which):
+        """A tool installed after a negative lookup is found after clear_cache()."""
+        mock_which.return_value = None
+        assert DependencyHelper.exists("rclone") is False
+
+        mock_which.return_value = "/usr/bin/rclone"
+        assert DependencyHelper.exists("rclone") is False
+
+        DependencyHelper.clear_cache()
+        assert DependencyHelper.exists("rclone") is True
+
+
 class TestDependencyHelperGetVersion:
     """Tests for get_version() method."""
 
@@ -231,6 +258,68 @@ class TestDependencyHelperGetVersion:
         assert version == "1.2"
 
 
+class TestDependencyHelperVersionCache:
+    """Stock version lookups are persisted, keyed by the binary's stat data."""
+
+    @pytest.fixture
+    def fake_rclone(self, tmp_path):
+        binary = tmp_path / "rclone"
+        binary.write_text("#!/bin/sh\n")
+        with patch('shutil.which', return_value=str(binary)):
+            yield binary
+
+    @patch('subprocess.run')
+    def test_version_served_from_cache(self, mock_run, fake_rclone):
+        """A second lookup (e.g. the next CLI run) does not fork the tool."""
+        mock_run.return_value = Mock(stdout="rclone v1.66.0\n", stderr="", returncode=0)
+
+        assert DependencyHelper.get_version("rclone") == "1.66.0"
+        DependencyHelper.clear_cache()
+        assert DependencyHelper.get_version("rclone") == "1.66.0"
+
+        mock_run.assert_called_once()
+
+    @patch('subprocess.run')
+    def test_replaced_binary_is_reprobed(self, mock_run, fake_rclone):
+        """Upgrading the tool changes its fingerprint and invalidates the entry."""
+        mock_run.return_value = Mock(stdout="rclone v1.66.0\n", stderr="", returncode=0)
+        DependencyHelper.get_version("rclone")
+
+        fake_rclone.write_text("#!/bin/sh\n# upgraded\n")
+        mock_run.return_value = Mock(stdout="rclone v1.67.0\n", stderr="", returncode=0)
+
+        assert DependencyHelper.get_version("rclone") == "1.67.0"
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_custom_command_and_docker_not_cached(self, mock_run, fake_rclone):
+        """Custom version commands and the docker daemon version always run."""
+        mock_run.return_value = Mock(stdout="1.0.0\n", stderr="", returncode=0)
+
+        DependencyHelper.get_version("rclone", ["rclone", "--version"])
+        DependencyHelper.get_version("rclone", ["rclone", "--version"])
+        DependencyHelper.get_version("docker")
+        DependencyHelper.get_version("docker")
+
+        assert mock_run.call_count == 4
+
+    @patch('subprocess.run')
+    def test_cache_written_via_unique_temp_file(self, mock_run, fake_rclone, tmp_path):
+        """Concurrent writers never share a temp file; none is left behind."""
+        mock_run.return_value = Mock(stdout="rclone v1.66.0\n", stderr="", returncode=0)
+
+        with patch(
+            'kopi_docka.helpers.dependency_helper.tempfile.mkstemp',
+            wraps=tempfile.mkstemp,
+        ) as mkstemp:
+            DependencyHelper.get_version("rclone")
+
+        cache_dir = tmp_path / "xdg-cache" / "kopi-docka"
+        mkstemp.assert_called_once()
+        assert mkstemp.call_args.kwargs["dir"] == cache_dir
+        assert [p.name for p in cache_dir.iterdir()] == ["tool-versions.json"]
+
+
 class TestDependencyHelperCheck:
     """Tests for check() method."""
 
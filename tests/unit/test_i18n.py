@@ -0,0 +1,74 @@
+"""
+Unit tests for kopi_docka.i18n.
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from kopi_docka import i18n
+
+
+@pytest.mark.unit
+class TestTranslations:
+    """t() looks up the built-in dictionary; _() sets up gettext on first use."""
+
+    def test_t_uses_requested_language(self):
+        assert i18n.t("common.yes", "de") == "Ja"
+
+    def test_t_falls_back_to_english_then_key(self):
+        assert i18n.t("common.yes", "fr") == i18n.t("common.yes", "en")
+        assert i18n.t("no.such.key", "de") == "no.such.key"
+
+    def test_import_does_not_load_gettext_catalog(self):
+        code = "from kopi_docka import i18n; print(i18n._translate is None)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "True"
+
+    def test_underscore_initializes_lazily(self, monkeypatch):
+        monkeypatch.setattr(i18n, "_translate", None)
+
+        assert i18n._("Untranslated message") == "Untranslated message"
+        assert i18n._translate is not None
+
+    def test_catalog_loaded_once_per_language(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(i18n, "_TRANSLATION_CACHE", {})
+        monkeypatch.setattr(i18n, "LOCALE_DIR", tmp_path)
+        monkeypatch.setattr(i18n, "_translate", None)
+        monkeypatch.setattr(i18n, "_current_lang", None)
+
+        with patch.object(i18n.gettext, "translation", wraps=i18n.gettext.translation) as loader:
+            i18n.set_language("de")
+            i18n.set_language("en")
+            i18n.set_language("de")
+
+        assert loader.call_count == 2
+        assert set(i18n._TRANSLATION_CACHE) == {"de", "en"}
+
+    def test_language_detected_once_and_overridable(self, monkeypatch):
+        monkeypatch.setattr(i18n, "_translate", None)
+        monkeypatch.setattr(i18n, "_current_lang", None)
+        monkeypatch.setenv("LANGUAGE", "de_DE.UTF-8")
+
+        assert i18n.get_current_language() == "de"
+        monkeypatch.setenv("LANGUAGE", "en_US.UTF-8")
+        assert i18n.get_current_language() == "de"  # cached for the process
+
+        i18n.set_language("en")
+        assert i18n.get_current_language() == "en"
+        assert i18n.t("common.yes") == "Yes"
+
+    def test_missing_locale_dir_skips_gettext(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(i18n, "_TRANSLATION_CACHE", {})
+        monkeypatch.setattr(i18n, "_translate", None)
+        monkeypatch.setattr(i18n, "LOCALE_DIR", tmp_path / "locales")
+
+        with patch.object(i18n.gettext, "translation") as loader:
+            translate = i18n.setup_i18n("de")
+
+        loader.assert_not_called()
+        assert translate("Quit") == "Quit"
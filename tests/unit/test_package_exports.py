@@ -0,0 +1,51 @@
+"""
+Unit tests for the lazy re-exports in kopi_docka/__init__.py and
+kopi_docka/cores/__init__.py.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import kopi_docka
+import kopi_docka.cores
+
+
+@pytest.mark.unit
+class TestLazyPackageExports:
+    """Public names resolve on first access; submodule imports stay light."""
+
+    def test_all_exports_resolve(self):
+        for name in kopi_docka.__all__:
+            assert getattr(kopi_docka, name) is not None
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            kopi_docka.DoesNotExist
+
+    def test_submodule_import_skips_cores(self):
+        code = "import sys, kopi_docka.types; print('kopi_docka.cores' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+@pytest.mark.unit
+class TestLazyCoresExports:
+    """kopi_docka.cores loads only the manager module that is asked for."""
+
+    def test_all_exports_resolve(self):
+        for name in kopi_docka.cores.__all__:
+            assert getattr(kopi_docka.cores, name) is not None
+
+    def test_importing_one_manager_skips_the_others(self):
+        code = (
+            "import sys; from kopi_docka.cores import KopiaRepository; "
+            "print('kopi_docka.cores.restore_manager' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
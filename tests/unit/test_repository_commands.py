@@ -78,6 +78,26 @@ class TestRepoStatusCommand:
         assert result.exit_code == 0
         assert "KOPIA REPOSITORY STATUS" in result.stdout
         assert "Connected" in result.stdout
+        # Units are derived from the same snapshot list (one 'snapshot list' call)
+        mock_repo.list_snapshots.assert_called_once()
+        mock_repo.list_backup_units.assert_called_once_with(sample_snapshots)
+
+    @patch("kopi_docka.commands.repository_commands.KopiaRepository")
+    def test_repo_status_prints_kopia_params_verbatim(
+        self, mock_repo_class, cli_runner, mock_root, tmp_config
+    ):
+        """Brackets in kopia_params are not swallowed as Rich markup."""
+        mock_repo = mock_repo_class.return_value
+        mock_repo.is_connected.return_value = True
+        mock_repo.profile_name = "test-profile"
+        mock_repo.kopia_params = "rclone --remote-path=[bold]x:kopia"
+        mock_repo.list_snapshots.return_value = []
+        mock_repo.list_backup_units.return_value = []
+
+        result = cli_runner.invoke(app, ["repo-status", "--config", str(tmp_config)])
+
+        assert result.exit_code == 0
+        assert "[bold]x:kopia" in result.stdout
 
 
 @pytest.mark.unit
@@ -185,6 +205,35 @@ class TestRepoInitPathCommand:
 
         assert result.exit_code == 0
         assert "Repository created & connected" in result.stdout
+        resolved = str(repo_path.resolve())
+        create_cmd = mock_run.call_args_list[0].args[0]
+        assert create_cmd[:6] == [
+            "kopia", "repository", "create", "filesystem", "--path", resolved,
+        ]  # fmt: skip
+        assert create_cmd[-2:] == ["--config-file", str(tmp_path / "config.json")]
+        assert mock_run.call_args_list[1].args[0] == [
+            "kopia", "repository", "connect", "filesystem", "--path", resolved,
+            "--config-file", str(tmp_path / "config.json"),
+        ]  # fmt: skip
+
+    @patch("kopi_docka.commands.repository_commands.run_command")
+    @patch("kopi_docka.commands.repository_commands.KopiaRepository")
+    def test_init_path_prints_kopia_error_verbatim(
+        self, mock_repo_class, mock_run, cli_runner, mock_root, tmp_config, tmp_path
+    ):
+        """Brackets in kopia's stderr are shown as-is, not parsed as Rich markup."""
+        mock_repo = mock_repo_class.return_value
+        mock_repo._get_env.return_value = {}
+        mock_repo._get_config_file.return_value = str(tmp_path / "config.json")
+        mock_repo.profile_name = "test-profile"
+        mock_run.return_value = Mock(returncode=1, stdout="", stderr="ERROR [/storage] denied")
+
+        result = cli_runner.invoke(
+            app, ["repo-init-path", str(tmp_path / "repo"), "--config", str(tmp_config)]
+        )
+
+        assert result.exit_code == 1
+        assert "ERROR [/storage] denied" in result.stdout
 
 
 @pytest.mark.unit